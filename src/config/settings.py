@@ -1,24 +1,49 @@
 """Application settings and configuration management."""
 
+import functools
+import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from services.data_service import DataService
 
-@dataclass
+# Read .env once at import so every ApiConfig sees the same keys
+load_dotenv(override=True)
+_GENIUS_API_KEY = os.getenv("GENIUS_ACCESS_TOKEN")
+_TMDB_API_KEY = os.getenv("TMDB_API_KEY")
+
+# API keys come from the environment only and are never written to preferences
+_SECRET_API_FIELDS = ("geniusApiKey", "tmdbApiKey")
+
+# Settings attributes persisted as sections of the preferences file
+_CONFIG_SECTIONS = ("model", "api", "ui", "logging", "data", "cache")
+
+# Themes that can be restored from preferences.json or a legacy launch.txt
+_VALID_THEMES = frozenset({"Oblivion", "blue", "green", "dark-blue"})
+
+# Repository root, three levels above this file (src/config/settings.py)
+_APP_ROOT = Path(__file__).parent.parent.parent
+
+
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for sentiment analysis models."""
 
     primaryModel: str = "cardiffnlp/twitter-roberta-base-sentiment-latest"
     maxTextLength: int = 512
     confidenceThreshold: float = 0.5
+    batchSize: int = 32  # texts per forward pass in batched analysis
+    quantizeOnCpu: bool = False  # opt-in int8 dynamic quantization without a GPU
+    halfPrecisionOnGpu: bool = True  # fp16 weights when running on CUDA
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiConfig:
     """Configuration for external API services."""
 
@@ -33,7 +58,7 @@ class ApiConfig:
     cacheExpiry: int = 3600  # 1 hour in seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class UiConfig:
     """Configuration for user interface."""
 
@@ -43,7 +68,7 @@ class UiConfig:
     windowHeight: int = 450
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Configuration for logging system."""
 
@@ -54,7 +79,7 @@ class LoggingConfig:
     backupCount: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class DataConfig:
     """Configuration for data persistence."""
 
@@ -62,7 +87,7 @@ class DataConfig:
     maxHistoryRecords: int = 10000
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Configuration for caching system."""
 
@@ -77,13 +102,15 @@ class Settings:
 
     def __init__(self) -> None:
         """Initialize settings with default values and load from environment."""
-        self._loadEnvironment()
-
         # Get application paths
-        self.appRoot = Path(__file__).parent.parent.parent
+        self.appRoot = _APP_ROOT
         self.assetsPath = self.appRoot / "assets"
         self.themesPath = self.assetsPath / "themes"
 
+        # Path lookups are pure, so repeat calls for the same name hit the cache
+        self._resolveThemePath = functools.lru_cache(maxsize=64)(self._resolveThemePath)
+        self.getAssetPath = functools.lru_cache(maxsize=64)(self.getAssetPath)
+
         # Set up data directory structure
         self.dataPath = self.appRoot / "data"
         self.logsPath = self.dataPath / "logs"
@@ -91,53 +118,53 @@ class Settings:
         self.databasePath = self.dataPath / "database"
 
         # Create directories if they don't exist
-        self.dataPath.mkdir(exist_ok=True)
-        self.logsPath.mkdir(exist_ok=True)
-        self.settingsPath.mkdir(exist_ok=True)
-        self.databasePath.mkdir(exist_ok=True)
+        self._createdDirectories: set[Path] = set()
+        for directory in (
+            self.dataPath,
+            self.logsPath,
+            self.settingsPath,
+            self.databasePath,
+        ):
+            self._ensureDirectory(directory)
 
         # Initialize configuration sections
         self.model = ModelConfig()
-        self.api = ApiConfig(
-            geniusApiKey=os.getenv("GENIUS_ACCESS_TOKEN"),
-            tmdbApiKey=os.getenv("TMDB_API_KEY"),
-        )
+        self.api = ApiConfig(geniusApiKey=_GENIUS_API_KEY, tmdbApiKey=_TMDB_API_KEY)
         self.ui = UiConfig()
         self.logging = LoggingConfig()
         self.data = DataConfig()
         self.cache = CacheConfig()
 
+        # Persistence state: DataService is created on first save, and the last
+        # written preferences let save() skip writes that change nothing
+        self._dataService: DataService | None = None
+        self._lastSavedPreferences: dict[str, Any] | None = None
+        self._preferencesCache: dict[str, Any] | None = None
+        self._preferencesMtime: int | None = None
+
         # Load theme preference
         self._loadThemePreference()
 
         # Load saved settings from preferences file
         self.load()
 
-    def _loadEnvironment(self) -> None:
-        """Load environment variables from .env file."""
-        load_dotenv(override=True)
-
     def _loadThemePreference(self) -> None:
         """Load theme preference from preferences.json file."""
         try:
             # Try to load from preferences.json first
-            prefsPath = self.settingsPath / "preferences.json"
-            if prefsPath.exists():
-                import json
-
-                with open(prefsPath) as f:
-                    preferences = json.load(f)
-                    if "ui" in preferences and "defaultTheme" in preferences["ui"]:
-                        theme = preferences["ui"]["defaultTheme"]
-                        if theme in ["Oblivion", "blue", "green", "dark-blue"]:
-                            self.ui.defaultTheme = theme
-                            return
+            preferences = self._readPreferences()
+            if preferences is not None:
+                if "ui" in preferences and "defaultTheme" in preferences["ui"]:
+                    theme = preferences["ui"]["defaultTheme"]
+                    if theme in _VALID_THEMES:
+                        self.ui.defaultTheme = theme
+                        return
 
             # Fallback: check for legacy launch.txt file and migrate
             launchFile = self.appRoot / "launch.txt"
             if launchFile.exists():
                 theme = launchFile.read_text().strip()
-                if theme in ["Oblivion", "blue", "green", "dark-blue"]:
+                if theme in _VALID_THEMES:
                     self.ui.defaultTheme = theme
                     # Migrate to preferences.json and remove launch.txt
                     self._migrateThemePreference()
@@ -177,8 +204,10 @@ class Settings:
 
     def getThemePath(self, themeName: str = None) -> Path:
         """Get path to theme file."""
-        theme = themeName or self.ui.defaultTheme
+        return self._resolveThemePath(themeName or self.ui.defaultTheme)
 
+    def _resolveThemePath(self, theme: str) -> Path:
+        """Map a theme name to its file path, or to the name for built-ins."""
         if theme == "Oblivion":
             return self.themesPath / "oblivion.json"
         else:
@@ -191,80 +220,76 @@ class Settings:
 
     def getDataPath(self) -> Path:
         """Get the data storage directory path."""
-        dataPath = self.appRoot / self.data.dataDirectory
-        dataPath.mkdir(exist_ok=True)
-        return dataPath
+        return self._ensureDirectory(self.appRoot / self.data.dataDirectory)
 
     def getSettingsPath(self) -> Path:
         """Get the settings storage directory path."""
-        settingsPath = self.dataPath / "settings"
-        settingsPath.mkdir(exist_ok=True)
-        return settingsPath
+        return self._ensureDirectory(self.settingsPath)
 
     def getDatabasePath(self) -> Path:
         """Get the database storage directory path."""
-        databasePath = self.dataPath / "database"
-        databasePath.mkdir(exist_ok=True)
-        return databasePath
+        return self._ensureDirectory(self.databasePath)
+
+    def _ensureDirectory(self, path: Path) -> Path:
+        """Create a directory the first time it is requested.
+
+        Args:
+            path: Directory to create
+
+        Returns:
+            The same path
+        """
+        if path not in self._createdDirectories:
+            path.mkdir(parents=True, exist_ok=True)
+            self._createdDirectories.add(path)
+        return path
 
     def toDict(self) -> dict[str, Any]:
         """Convert settings to dictionary."""
-        return {
-            "model": self.model.__dict__,
-            "api": self.api.__dict__,
-            "ui": self.ui.__dict__,
-            "logging": self.logging.__dict__,
-            "data": self.data.__dict__,
-            "cache": self.cache.__dict__,
-        }
+        config = {name: asdict(getattr(self, name)) for name in _CONFIG_SECTIONS}
+        for key in _SECRET_API_FIELDS:
+            config["api"].pop(key, None)
+        return config
 
     def updateFromDict(self, config: dict[str, Any]) -> None:
         """Update settings from dictionary."""
-        if "model" in config:
-            for key, value in config["model"].items():
-                if hasattr(self.model, key):
-                    setattr(self.model, key, value)
-
-        if "api" in config:
-            for key, value in config["api"].items():
-                if hasattr(self.api, key):
-                    setattr(self.api, key, value)
-
-        if "ui" in config:
-            for key, value in config["ui"].items():
-                if hasattr(self.ui, key):
-                    setattr(self.ui, key, value)
-
-        if "logging" in config:
-            for key, value in config["logging"].items():
-                if hasattr(self.logging, key):
-                    setattr(self.logging, key, value)
-
-        if "data" in config:
-            for key, value in config["data"].items():
-                if hasattr(self.data, key):
-                    setattr(self.data, key, value)
-
-        if "cache" in config:
-            for key, value in config["cache"].items():
-                if hasattr(self.cache, key):
-                    setattr(self.cache, key, value)
+        for name in _CONFIG_SECTIONS:
+            values = config.get(name)
+            if not values:
+                continue
+
+            target = getattr(self, name)
+            validFields = target.__dataclass_fields__
+            for key, value in values.items():
+                if key in validFields and not (
+                    name == "api" and key in _SECRET_API_FIELDS
+                ):
+                    setattr(target, key, value)
 
     def save(self) -> None:
-        """Save current settings to preferences file."""
+        """Save current settings to preferences file if they have changed."""
         try:
-            from services.data_service import DataService
-
-            # Get data service instance with new structured paths
-            data_service = DataService(
-                dataDir=self.getDataPath(),
-                settingsDir=self.getSettingsPath(),
-                databaseDir=self.getDatabasePath(),
-            )
+            # toDict copies each section, so the snapshot can't alias live config
+            preferences = self.toDict()
+            if preferences == self._lastSavedPreferences:
+                logging.debug("Settings unchanged, skipping save")
+                return
+
+            if self._dataService is None:
+                # Deferred: the services package imports utils.logger, which
+                # imports this module, and pulls in the model stack
+                from services.data_service import DataService
+
+                # Get data service instance with new structured paths
+                self._dataService = DataService(
+                    dataDir=self.getDataPath(),
+                    settingsDir=self.getSettingsPath(),
+                    databaseDir=self.getDatabasePath(),
+                )
 
             # Save settings as preferences
-            preferences = self.toDict()
-            data_service.saveUserPreferences(preferences)
+            self._dataService.saveUserPreferences(preferences)
+            self._lastSavedPreferences = preferences
 
             logging.info("Settings saved successfully")
 
@@ -272,16 +297,33 @@ class Settings:
             logging.error(f"Failed to save settings: {e}")
             raise
 
+    def _readPreferences(self) -> dict[str, Any] | None:
+        """Read preferences.json, reusing the last parse if the file is unchanged.
+
+        Returns:
+            Parsed preferences, or None if the file does not exist
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+        """
+        prefsPath = self.settingsPath / "preferences.json"
+        try:
+            mtime = prefsPath.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        if mtime != self._preferencesMtime:
+            self._preferencesCache = json.loads(prefsPath.read_bytes())
+            self._preferencesMtime = mtime
+        return self._preferencesCache
+
     def load(self) -> None:
         """Load settings from preferences file."""
         try:
             # Load preferences file if it exists
-            prefs_path = self.settingsPath / "preferences.json"
-            if prefs_path.exists():
-                import json
-
-                with open(prefs_path) as f:
-                    preferences = json.load(f)
+            preferences = self._readPreferences()
+            if preferences is not None:
                 self.updateFromDict(preferences)
                 logging.info("Settings loaded from preferences file")
 
@@ -294,10 +336,7 @@ class Settings:
         try:
             # Reset all config sections to their default values
             self.model = ModelConfig()
-            self.api = ApiConfig(
-                geniusApiKey=os.getenv("GENIUS_ACCESS_TOKEN"),
-                tmdbApiKey=os.getenv("TMDB_API_KEY"),
-            )
+            self.api = ApiConfig(geniusApiKey=_GENIUS_API_KEY, tmdbApiKey=_TMDB_API_KEY)
             self.ui = UiConfig()
             self.logging = LoggingConfig()
             self.data = DataConfig()
@@ -1,8 +1,10 @@
 """Data models for Text Gauntlet application."""
 
+import heapq
 import time
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 
 
@@ -47,7 +49,7 @@ class EmotionLabel(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentScore:
     """Individual sentiment score with label and confidence."""
 
@@ -60,7 +62,7 @@ class SentimentScore:
             raise ValueError(f"Score must be between 0.0 and 1.0, got {self.score}")
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentResult:
     """Complete sentiment analysis result."""
 
@@ -74,13 +76,13 @@ class SentimentResult:
 
     def __post_init__(self) -> None:
         """Set timestamp if not provided."""
-        if not hasattr(self, "timestamp") or self.timestamp == 0:
+        if self.timestamp == 0:
             self.timestamp = time.time()
 
     @property
     def topEmotions(self) -> list[SentimentScore]:
         """Get top 3 emotions by score."""
-        return sorted(self.scores, key=lambda x: x.score, reverse=True)[:3]
+        return heapq.nlargest(3, self.scores, key=attrgetter("score"))
 
     def toDict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -187,7 +189,7 @@ class AnalysisSession:
 
     def __post_init__(self) -> None:
         """Initialize timestamps."""
-        if not hasattr(self, "startTime") or self.startTime == 0:
+        if self.startTime == 0:
             self.startTime = time.time()
 
     def addResult(self, result: SentimentResult) -> None:
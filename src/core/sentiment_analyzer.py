@@ -1,14 +1,13 @@
 """Modern sentiment analysis core using transformer models."""
 
+import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
-import torch
-from transformers import (
-    AutoModelForSequenceClassification,
-    AutoTokenizer,
-    pipeline,
-)
-
+from config.settings import settings
 from core.models import (
     SentimentResult,
     SentimentScore,
@@ -18,6 +17,23 @@ from core.text_processor import ProcessedText, TextProcessor
 from utils.exceptions import AnalysisError
 from utils.logger import logger
 
+if TYPE_CHECKING:
+    from transformers import BatchEncoding, PreTrainedModel, PreTrainedTokenizerBase
+
+# Model context size in tokens, and the overlap between consecutive windows
+_MAX_TOKENS = 512
+_WINDOW_STRIDE = 64
+
+# Model-specific class labels mapped to the standardized sentiment labels
+_LABEL_MAPPING = {
+    "LABEL_0": "negative",
+    "LABEL_1": "neutral",
+    "LABEL_2": "positive",
+    "NEGATIVE": "negative",
+    "NEUTRAL": "neutral",
+    "POSITIVE": "positive",
+}
+
 
 class SentimentAnalyzer:
     """Advanced sentiment analyzer using modern transformer models."""
@@ -32,33 +48,106 @@ class SentimentAnalyzer:
             modelName: HuggingFace model name for sentiment analysis
         """
         self.modelName = modelName
-        self.pipeline: pipeline | None = None
-        self.tokenizer: AutoTokenizer | None = None
-        self.model: AutoModelForSequenceClassification | None = None
+        self.tokenizer: PreTrainedTokenizerBase | None = None
+        self.model: PreTrainedModel | None = None
+        self._classLabels: list[str] = []
         self.textProcessor = TextProcessor()
         self.isLoaded = False
+        self._loadLock = threading.Lock()
+
+        # Re-analyzing the same text reuses its scores instead of the model;
+        # least recently used entries are evicted first
+        self._scoreCache: OrderedDict[str, tuple[SentimentScore, ...]] = OrderedDict()
+        self._scoreCacheSize = settings.cache.maxSize
+        self._scoreCacheLock = threading.Lock()
 
         logger.info(f"Sentiment analyzer initialized with model: {modelName}")
 
     def loadModel(self) -> None:
-        """Load the sentiment analysis model and tokenizer."""
+        """Load the sentiment analysis model and tokenizer.
+
+        Safe to call from several worker threads at once; the weights are
+        only loaded by the first caller.
+        """
+        with self._loadLock:
+            if self.isLoaded:
+                return
+            self._loadModelUnlocked()
+
+    def loadModelInBackground(self) -> None:
+        """Start loading the model on a daemon thread.
+
+        Analyses started before loading finishes wait on the load lock
+        instead of loading the weights a second time.
+        """
+
+        def loadTask() -> None:
+            try:
+                self.loadModel()
+            except AnalysisError:
+                # Already logged; the next analysis retries the load
+                pass
+
+        threading.Thread(target=loadTask, name="model-loader", daemon=True).start()
+
+    def _loadModelUnlocked(self) -> None:
+        """Load the model and tokenizer; the caller must hold the load lock."""
         try:
+            # torch and transformers are imported lazily to keep them off the
+            # startup path; the UI can come up before either is loaded
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
             logger.info(f"Loading model: {self.modelName}")
 
-            # Load tokenizer and model
-            self.tokenizer = AutoTokenizer.from_pretrained(self.modelName)
+            # Load tokenizer and model, insisting on the Rust-backed fast tokenizer
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.modelName, use_fast=True
+            )
+            if not self.tokenizer.is_fast:
+                logger.warning(
+                    f"No fast tokenizer available for {self.modelName}; "
+                    "tokenization will be slower"
+                )
+
+            # fp16 halves GPU weight memory and speeds up CUDA inference
+            useCuda = torch.cuda.is_available()
+            modelDtype = (
+                torch.float16
+                if useCuda and settings.model.halfPrecisionOnGpu
+                else torch.float32
+            )
             self.model = AutoModelForSequenceClassification.from_pretrained(
-                self.modelName
+                self.modelName, torch_dtype=modelDtype
             )
 
-            # Create pipeline for easier inference
-            self.pipeline = pipeline(
-                "sentiment-analysis",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                top_k=None,  # Get all labels
-                device=0 if torch.cuda.is_available() else -1,
-            )
+            # Let intra-op GEMMs use the cores; the Tk thread keeps one spare
+            if not useCuda:
+                torch.set_num_threads(max(1, (os.cpu_count() or 1) - 1))
+                try:
+                    torch.set_num_interop_threads(1)
+                except RuntimeError:
+                    # Can only be set before the first parallel operation
+                    pass
+
+            # Optionally quantize linear layers to int8 for faster, lighter CPU
+            # inference; off by default since it shifts the scores slightly
+            if settings.model.quantizeOnCpu and not useCuda:
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Model quantized to int8 for CPU inference")
+
+            # Standardized label for each class id, resolved once per load
+            id2label = self.model.config.id2label
+            self._classLabels = [
+                _LABEL_MAPPING.get(id2label[i].upper(), id2label[i].lower())
+                for i in range(len(id2label))
+            ]
+
+            # Inputs are moved to self.model.device, so placing the model is enough
+            if useCuda:
+                self.model = self.model.to("cuda")
 
             self.isLoaded = True
             logger.info("Model loaded successfully")
@@ -120,32 +209,216 @@ class SentimentAnalyzer:
         """
         Analyze multiple texts efficiently.
 
+        Texts with cached scores reuse them and the rest are scored together
+        in batched forward passes; if that fails, each text is analyzed on
+        its own so one bad input does not sink the whole batch.
+
         Args:
             textInputs: List of text inputs to analyze
 
         Returns:
             List of sentiment results
         """
-        results = []
-
         logger.info(f"Starting batch analysis of {len(textInputs)} texts")
 
-        for i, textInput in enumerate(textInputs):
-            try:
-                result = self.analyzeText(textInput)
-                results.append(result)
+        try:
+            if not self.isLoaded:
+                self.loadModel()
 
-                if (i + 1) % 10 == 0:
-                    logger.debug(f"Processed {i + 1}/{len(textInputs)} texts")
+            startTime = time.time()
+            processedTexts = self.textProcessor.batchProcess(textInputs)
+            texts = [processed.processedText for processed in processedTexts]
+
+            # Reuse cached scores and send only the misses to the model
+            useCache = settings.cache.enabled
+            allScores: list[list[SentimentScore] | None] = [None] * len(texts)
+            if useCache:
+                for i, text in enumerate(texts):
+                    cached = self._getCachedScores(text) if text.strip() else None
+                    if cached is not None:
+                        allScores[i] = [
+                            SentimentScore(s.label, s.score) for s in cached
+                        ]
+
+            missing = [i for i, scores in enumerate(allScores) if scores is None]
+            predicted = self._predictBatch([texts[i] for i in missing])
+            for i, scores in zip(missing, predicted, strict=True):
+                allScores[i] = scores
+                if useCache and texts[i].strip():
+                    self._storeScores(
+                        texts[i],
+                        tuple(SentimentScore(s.label, s.score) for s in scores),
+                    )
+
+            processingTime = (time.time() - startTime) / max(len(textInputs), 1)
+
+            results = []
+            for textInput, scores in zip(textInputs, allScores, strict=True):
+                primarySentiment, confidence = self._determinePrimarySentiment(scores)
+                results.append(
+                    SentimentResult(
+                        text=textInput.content,
+                        scores=scores,
+                        primarySentiment=primarySentiment,
+                        confidence=confidence,
+                        processingTime=processingTime,
+                        timestamp=time.time(),
+                    )
+                )
 
-            except Exception as e:
-                logger.warning(f"Failed to analyze text {i + 1}: {e}")
-                # Create a minimal result for failed analysis
-                results.append(self._createFailedResult(textInput, str(e)))
+        except Exception as e:
+            logger.warning(f"Batched analysis failed, analyzing texts one by one: {e}")
+            results = []
+            for i, textInput in enumerate(textInputs):
+                try:
+                    results.append(self.analyzeText(textInput))
+                except Exception as e:
+                    logger.warning(f"Failed to analyze text {i + 1}: {e}")
+                    # Create a minimal result for failed analysis
+                    results.append(self._createFailedResult(textInput, str(e)))
 
         logger.info(f"Batch analysis complete: {len(results)} results")
         return results
 
+    def analyzeSegments(
+        self, textInput: TextInput, segments: list[str]
+    ) -> SentimentResult:
+        """
+        Analyze a text made of independent segments, such as a set of reviews.
+
+        Each segment is scored on its own in batched forward passes and
+        the per-label scores are averaged, so every segment contributes to
+        the overall sentiment. Segments longer than the model context are
+        scored in overlapping token windows rather than truncated.
+
+        Args:
+            textInput: Combined text the result should describe
+            segments: Individual texts to score
+
+        Returns:
+            SentimentResult with scores averaged across segments
+
+        Raises:
+            AnalysisError: If no segment has text or analysis fails
+        """
+        if not any(segment.strip() for segment in segments):
+            raise AnalysisError("No segment text to analyze", "analysis")
+
+        startTime = time.time()
+
+        try:
+            if not self.isLoaded:
+                self.loadModel()
+
+            processedTexts = self.textProcessor.batchProcess(
+                [
+                    TextInput(content=segment, source=textInput.source)
+                    for segment in segments
+                ]
+            )
+            allScores = self._predictBatch(
+                [processed.processedText for processed in processedTexts]
+            )
+
+            # Average each label's score over all segments
+            totals: dict[str, float] = {}
+            for scores in allScores:
+                for score in scores:
+                    totals[score.label] = totals.get(score.label, 0.0) + score.score
+            scores = sorted(
+                (
+                    SentimentScore(label=label, score=total / len(allScores))
+                    for label, total in totals.items()
+                ),
+                key=lambda x: x.score,
+                reverse=True,
+            )
+
+            primarySentiment, confidence = self._determinePrimarySentiment(scores)
+
+            return SentimentResult(
+                text=textInput.content,
+                scores=scores,
+                primarySentiment=primarySentiment,
+                confidence=confidence,
+                processingTime=time.time() - startTime,
+                timestamp=time.time(),
+            )
+
+        except Exception as e:
+            logger.error(f"Segment analysis failed: {e}")
+            raise AnalysisError(f"Sentiment analysis failed: {e}", "analysis") from e
+
+    def _predictBatch(self, texts: list[str]) -> list[list[SentimentScore]]:
+        """
+        Score several texts in batched forward passes.
+
+        Texts longer than the model context are split into overlapping
+        token windows whose probabilities are averaged, as in _scoreText.
+
+        Args:
+            texts: Preprocessed texts to score
+
+        Returns:
+            Sentiment scores for each text, in input order
+        """
+        import torch
+
+        # Empty texts are neutral and never reach the model
+        pending = [i for i, text in enumerate(texts) if text.strip()]
+        allScores = [[SentimentScore(label="neutral", score=1.0)] for _ in texts]
+
+        # Batch texts of similar length together so little of each batch is
+        # padding; results are written back by index, so order is preserved
+        pending.sort(key=lambda i: len(texts[i]))
+
+        batchSize = max(1, settings.model.batchSize)
+        chunks = [
+            pending[start : start + batchSize]
+            for start in range(0, len(pending), batchSize)
+        ]
+
+        def encodeChunk(indices: list[int]) -> tuple["BatchEncoding", "torch.Tensor"]:
+            encoding = self.tokenizer(
+                [texts[i] for i in indices],
+                max_length=_MAX_TOKENS,
+                truncation=True,
+                stride=_WINDOW_STRIDE,
+                return_overflowing_tokens=True,
+                padding=True,
+                return_tensors="pt",
+            )
+            # Position within the chunk of the text each window came from
+            sampleMapping = encoding.pop("overflow_to_sample_mapping")
+            return encoding, sampleMapping
+
+        # Tokenize the next chunk on a helper thread while the model runs on
+        # the current one; the fast tokenizer releases the GIL while encoding
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            nextEncoding = executor.submit(encodeChunk, chunks[0]) if chunks else None
+            for n, indices in enumerate(chunks):
+                encoding, sampleMapping = nextEncoding.result()
+                encoding = encoding.to(self.model.device)
+                if n + 1 < len(chunks):
+                    nextEncoding = executor.submit(encodeChunk, chunks[n + 1])
+
+                with torch.inference_mode():
+                    logits = self.model(**encoding).logits
+
+                    # Average class probabilities over each text's windows
+                    windowProbabilities = logits.float().softmax(dim=-1)
+                    sampleMapping = sampleMapping.to(windowProbabilities.device)
+                    totals = windowProbabilities.new_zeros(
+                        (len(indices), windowProbabilities.shape[-1])
+                    ).index_add_(0, sampleMapping, windowProbabilities)
+                    windowCounts = torch.bincount(sampleMapping, minlength=len(indices))
+                    probabilities = (totals / windowCounts.unsqueeze(-1)).tolist()
+
+                for i, row in zip(indices, probabilities, strict=True):
+                    allScores[i] = self._buildScores(row)
+
+        return allScores
+
     def _analyzeSentiment(self, processedText: ProcessedText) -> list[SentimentScore]:
         """
         Perform sentiment analysis on processed text.
@@ -163,45 +436,93 @@ class SentimentAnalyzer:
         if not text.strip():
             return [SentimentScore(label="neutral", score=1.0)]
 
-        # Truncate text if too long (model limit)
-        maxLength = 512
-        if len(text) > maxLength:
-            text = text[:maxLength]
-            logger.debug("Text truncated to fit model limit")
+        scoreText = self._cachedScoreText if settings.cache.enabled else self._scoreText
+        # Copy so callers can't mutate the cached scores
+        return [SentimentScore(s.label, s.score) for s in scoreText(text)]
 
-        # Get predictions from pipeline
-        predictions = self.pipeline(text)[0]  # Get first (and only) result
+    def _cachedScoreText(self, text: str) -> tuple[SentimentScore, ...]:
+        """
+        Score a non-empty text, reusing earlier scores for the same text.
 
-        # Convert to SentimentScore objects
-        scores = []
-        for pred in predictions:
-            # Map model labels to our format
-            label = self._mapLabel(pred["label"])
-            score = float(pred["score"])
-            scores.append(SentimentScore(label=label, score=score))
+        Args:
+            text: Processed text to score
 
+        Returns:
+            Sentiment scores, highest first; shared, so treat as read-only
+        """
+        scores = self._getCachedScores(text)
+        if scores is None:
+            scores = self._scoreText(text)
+            self._storeScores(text, scores)
         return scores
 
-    def _mapLabel(self, modelLabel: str) -> str:
+    def _getCachedScores(self, text: str) -> tuple[SentimentScore, ...] | None:
+        """Return the cached scores for a text and mark them recently used."""
+        with self._scoreCacheLock:
+            scores = self._scoreCache.get(text)
+            if scores is not None:
+                self._scoreCache.move_to_end(text)
+            return scores
+
+    def _storeScores(self, text: str, scores: tuple[SentimentScore, ...]) -> None:
+        """Cache the scores for a text, evicting the least recently used."""
+        with self._scoreCacheLock:
+            self._scoreCache[text] = scores
+            self._scoreCache.move_to_end(text)
+            while len(self._scoreCache) > self._scoreCacheSize:
+                self._scoreCache.popitem(last=False)
+
+    def _scoreText(self, text: str) -> tuple[SentimentScore, ...]:
         """
-        Map model-specific labels to standardized labels.
+        Run the model over a non-empty text.
 
         Args:
-            modelLabel: Label from the model
+            text: Processed text to score
 
         Returns:
-            Standardized label
+            Sentiment scores, highest first
+        """
+        import torch
+
+        # Score the whole text in overlapping token windows that fit the model
+        encoding = self.tokenizer(
+            text,
+            max_length=_MAX_TOKENS,
+            truncation=True,
+            stride=_WINDOW_STRIDE,
+            return_overflowing_tokens=True,
+            padding=True,
+            return_tensors="pt",
+        )
+        encoding.pop("overflow_to_sample_mapping", None)
+        encoding = encoding.to(self.model.device)
+
+        with torch.inference_mode():
+            logits = self.model(**encoding).logits
+
+        # Average class probabilities over all windows
+        probabilities = logits.float().softmax(dim=-1).mean(dim=0)
+        if logits.shape[0] > 1:
+            logger.debug(f"Text scored across {logits.shape[0]} token windows")
+
+        return tuple(self._buildScores(probabilities.tolist()))
+
+    def _buildScores(self, probabilities: list[float]) -> list[SentimentScore]:
         """
-        labelMapping = {
-            "LABEL_0": "negative",
-            "LABEL_1": "neutral",
-            "LABEL_2": "positive",
-            "NEGATIVE": "negative",
-            "NEUTRAL": "neutral",
-            "POSITIVE": "positive",
-        }
+        Convert per-class probabilities into sorted sentiment scores.
 
-        return labelMapping.get(modelLabel.upper(), modelLabel.lower())
+        Args:
+            probabilities: Probability for each model class, in label-id order
+
+        Returns:
+            Sentiment scores with standardized labels, highest first
+        """
+        scores = [
+            SentimentScore(label=label, score=float(probability))
+            for label, probability in zip(self._classLabels, probabilities, strict=True)
+        ]
+        scores.sort(key=lambda x: x.score, reverse=True)
+        return scores
 
     def _determinePrimarySentiment(
         self, scores: list[SentimentScore]
@@ -209,6 +530,9 @@ class SentimentAnalyzer:
         """
         Determine primary sentiment and confidence score.
 
+        Confidence is the margin between the top two scores, floored at 70%
+        of the top score so close calls are not reported as near-zero.
+
         Args:
             scores: List of sentiment scores
 
@@ -218,42 +542,21 @@ class SentimentAnalyzer:
         if not scores:
             return "neutral", 0.0
 
-        # Find highest scoring sentiment
-        topScore = max(scores, key=lambda x: x.score)
+        # Track the two highest scores in a single pass
+        topLabel = scores[0].label
+        topScore = secondScore = -1.0
+        for score in scores:
+            if score.score > topScore:
+                secondScore = topScore
+                topScore = score.score
+                topLabel = score.label
+            elif score.score > secondScore:
+                secondScore = score.score
 
-        # Calculate confidence based on score distribution
-        confidence = self._calculateConfidence(scores, topScore)
+        if len(scores) == 1:
+            return topLabel, topScore
 
-        return topScore.label, confidence
-
-    def _calculateConfidence(
-        self, scores: list[SentimentScore], topScore: SentimentScore
-    ) -> float:
-        """
-        Calculate confidence score based on prediction distribution.
-
-        Args:
-            scores: All sentiment scores
-            topScore: Highest scoring sentiment
-
-        Returns:
-            Confidence score between 0.0 and 1.0
-        """
-        if len(scores) <= 1:
-            return topScore.score
-
-        # Sort scores in descending order
-        sortedScores = sorted(scores, key=lambda x: x.score, reverse=True)
-
-        # Calculate confidence as difference between top two scores
-        topScore = sortedScores[0].score
-        secondScore = sortedScores[1].score if len(sortedScores) > 1 else 0.0
-
-        # Higher difference = higher confidence
-        confidence = topScore - secondScore
-
-        # Ensure confidence is reasonable (not too low)
-        return max(confidence, topScore * 0.7)
+        return topLabel, max(topScore - secondScore, topScore * 0.7)
 
     def _createFailedResult(self, textInput: TextInput, error: str) -> SentimentResult:
         """
@@ -282,22 +585,36 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with model information
         """
-        return {
-            "modelName": self.modelName,
-            "isLoaded": str(self.isLoaded),
-            "device": "cuda" if torch.cuda.is_available() else "cpu",
-            "torchVersion": torch.__version__,
-        }
+        info = {"modelName": self.modelName, "isLoaded": str(self.isLoaded)}
+        if self.isLoaded:
+            import torch
+
+            info["device"] = self.model.device.type
+            info["torchVersion"] = torch.__version__
+        else:
+            # Report without importing torch before the model needs it
+            info["device"] = "not loaded"
+            info["torchVersion"] = "not loaded"
+        return info
 
     def clearModel(self) -> None:
         """Clear model from memory to free resources."""
+        with self._loadLock:
+            self._clearModelUnlocked()
+
+    def _clearModelUnlocked(self) -> None:
+        """Release the model; the caller must hold the load lock."""
         if self.isLoaded:
-            self.pipeline = None
             self.tokenizer = None
             self.model = None
+            self._classLabels = []
             self.isLoaded = False
+            with self._scoreCacheLock:
+                self._scoreCache.clear()
 
             # Force garbage collection
+            import torch
+
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
 
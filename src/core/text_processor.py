@@ -1,205 +1,280 @@
 """Advanced text processing pipeline for Text Gauntlet."""
 
+import functools
 import re
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from core.models import TextInput
 from utils.exceptions import ValidationError
 from utils.logger import logger
 
-
-@dataclass
+# Repeated punctuation and contractions, rewritten together in one pass
+_NORMALIZATION_PATTERN = re.compile(r"\.{2,}|!{2,}|\?{2,}|n't|'re|'ve|'ll|'d|'m")
+_CONTRACTIONS = {
+    "n't": " not",
+    "'re": " are",
+    "'ve": " have",
+    "'ll": " will",
+    "'d": " would",
+    "'m": " am",
+}
+
+# Common English words used by the basic language heuristic
+_ENGLISH_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "is",
+        "in",
+        "to",
+        "of",
+        "a",
+        "that",
+        "it",
+        "with",
+        "for",
+        "as",
+        "was",
+        "on",
+        "are",
+        "you",
+        "this",
+        "be",
+        "at",
+        "have",
+        "not",
+        "or",
+        "from",
+        "by",
+        "they",
+        "we",
+        "can",
+        "an",
+        "your",
+        "all",
+        "but",
+        "will",
+        "one",
+        "would",
+        "there",
+        "their",
+    }
+)
+
+# Emoji runs, including ZWJ sequences and their variation selectors
+_EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001f000-\U0001faff"  # pictographs, emoticons, flags, skin tones
+    "\U000e0020-\U000e007f"  # subdivision flag tags
+    "\u2600-\u27bf"  # misc symbols & dingbats
+    "\u2b05-\u2b07"
+    "\u2b1b\u2b1c\u2b50\u2b55"
+    "\u2934\u2935"
+    "\u25aa\u25ab\u25b6\u25c0"
+    "\u25fb-\u25fe"
+    "\u231a\u231b"
+    "\u23cf"
+    "\u23e9-\u23f3"
+    "\u23f8-\u23fa"
+    "\u24c2"
+    "\u3030\u303d\u3297\u3299"
+    "\u200d"  # zero width joiner
+    "\u20e3"  # combining keycap
+    "\ufe0f"  # variation selector
+    "]+",
+    flags=re.UNICODE,
+)
+
+# A single character class rather than an alternation per character, so the
+# engine never backtracks; "$-_" also covers "%" escapes
+_URL_PATTERN = re.compile(r"https?://[a-zA-Z0-9$-_@.&+!*\\(),]+")
+
+_MENTION_PATTERN = re.compile(r"@[A-Za-z0-9_]+")
+_HASHTAG_PATTERN = re.compile(r"#[A-Za-z0-9_]+")
+
+# One alternation over all token kinds so a single scan both collects and
+# rewrites them; URLs go first since they may contain "@"
+_TOKEN_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern.pattern})"
+        for name, pattern in (
+            ("url", _URL_PATTERN),
+            ("mention", _MENTION_PATTERN),
+            ("hashtag", _HASHTAG_PATTERN),
+            ("emoji", _EMOJI_PATTERN),
+        )
+    )
+)
+
+# Substrings every non-emoji token starts with
+_TOKEN_MARKERS = ("http", "@", "#")
+
+# Emoji to text mapping for sentiment context
+_EMOJI_TO_TEXT = {
+    "😀": "happy",
+    "😃": "happy",
+    "😄": "happy",
+    "😁": "happy",
+    "😆": "happy",
+    "😅": "happy",
+    "😂": "happy",
+    "😍": "love",
+    "😘": "love",
+    "😗": "love",
+    "😙": "love",
+    "😚": "love",
+    "😋": "happy",
+    "😎": "cool",
+    "😏": "smirk",
+    "😐": "neutral",
+    "😑": "neutral",
+    "😶": "neutral",
+    "😒": "annoyed",
+    "😔": "sad",
+    "😢": "sad",
+    "😭": "sad",
+    "😮": "surprised",
+    "😲": "surprised",
+    "😴": "tired",
+    "😪": "tired",
+    "😫": "tired",
+    "😌": "sleepy",
+    "😇": "peaceful",
+    "😜": "playful",
+    "😝": "playful",
+    "🤪": "crazy",
+    "😛": "playful",
+    "🤤": "greedy",
+    "🤭": "giggling",
+    "🤫": "quiet",
+    "🤥": "lying",
+    "😶‍🌫️": "speechless",
+    "😬": "grimace",
+    "😟": "frowning",
+    "😧": "anguished",
+    "😦": "astonished",
+    "🥺": "pleading",
+    "😿": "crying",
+    "😾": "crying",
+    "😠": "angry",
+    "😡": "angry",
+    "🤬": "angry",
+    "😤": "angry",
+    "🤯": "mind_blown",
+    "😳": "flushed",
+    "🥵": "hot",
+    "🥶": "cold",
+    "😱": "scared",
+    "😨": "fearful",
+    "😰": "anxious",
+    "😞": "downcast",
+    "🤷": "shrugging",
+    "🙅": "no_good",
+    "🙆": "ok_gesture",
+    "🙋": "raising_hand",
+    "🤦": "facepalm",
+    "💕": "love",
+    "💖": "love",
+    "💗": "love",
+    "💓": "love",
+    "💞": "love",
+    "💘": "love",
+    "💝": "love",
+    "💟": "love",
+    "❤": "love",
+    "🧡": "love",
+    "💛": "love",
+    "💚": "love",
+    "💙": "love",
+    "💜": "love",
+    "🖤": "love",
+    "🤍": "love",
+    "🤎": "love",
+    "💔": "broken_heart",
+    "❣": "love",
+    "💯": "perfect",
+    "💢": "angry",
+    "💥": "explosive",
+    "💫": "dizzy",
+    "💦": "sweat",
+    "💨": "dash",
+    "🔥": "fire",
+    "✨": "sparkles",
+    "⭐": "star",
+    "🌟": "star",
+    "💀": "skull",
+    "👻": "ghost",
+    "👍": "thumbs_up",
+    "👎": "thumbs_down",
+    "👌": "ok",
+    "✌": "peace",
+    "🤞": "crossed_fingers",
+    "🤟": "love_you",
+    "🤘": "rock_on",
+    "🤙": "call_me",
+    "👈": "pointing",
+    "👉": "pointing",
+    "👆": "pointing",
+    "👇": "pointing",
+    "☝": "pointing",
+    "✋": "hand",
+    "🤚": "hand",
+    "🖐": "hand",
+    "🖖": "vulcan",
+    "👋": "wave",
+    "🤏": "pinch",
+    "💪": "muscle",
+    "🦾": "muscle",
+    "🦿": "leg",
+    "🦵": "leg",
+    "🦶": "foot",
+    "👂": "ear",
+    "🦻": "ear",
+    "👃": "nose",
+    "🧠": "brain",
+    "🦷": "tooth",
+    "🦴": "bone",
+    "👀": "eyes",
+    "👁": "eye",
+    "👅": "tongue",
+}
+
+# Padded replacement text per emoji, built once instead of per match
+_EMOJI_REPLACEMENTS = {emoji: f" {word} " for emoji, word in _EMOJI_TO_TEXT.items()}
+
+# Replacement for emojis without an entry in the emoji-to-text mapping
+_UNKNOWN_EMOJI_TEXT = " emoji "
+
+
+def _normalizeToken(match: re.Match[str]) -> str:
+    """Return the normalized form of a punctuation run or contraction."""
+    token = match.group(0)
+    return _CONTRACTIONS.get(token, token[0])
+
+
+@dataclass(slots=True)
 class ProcessedText:
     """Container for processed text with metadata."""
 
     originalText: str
     processedText: str
     detectedLanguage: str | None = None
-    extractedEmojis: list[str] = None
-    extractedUrls: list[str] = None
-    extractedMentions: list[str] = None
-    extractedHashtags: list[str] = None
+    extractedEmojis: list[str] = field(default_factory=list)
+    extractedUrls: list[str] = field(default_factory=list)
+    extractedMentions: list[str] = field(default_factory=list)
+    extractedHashtags: list[str] = field(default_factory=list)
     wordCount: int = 0
     characterCount: int = 0
 
-    def __post_init__(self) -> None:
-        """Initialize lists if None."""
-        if self.extractedEmojis is None:
-            self.extractedEmojis = []
-        if self.extractedUrls is None:
-            self.extractedUrls = []
-        if self.extractedMentions is None:
-            self.extractedMentions = []
-        if self.extractedHashtags is None:
-            self.extractedHashtags = []
-
 
 class TextProcessor:
     """Advanced text processor for sentiment analysis preparation."""
 
     def __init__(self) -> None:
         """Initialize text processor."""
-        self.emojiPattern = re.compile(
-            "["
-            "\U0001f600-\U0001f64f"  # emoticons
-            "\U0001f300-\U0001f5ff"  # symbols & pictographs
-            "\U0001f680-\U0001f6ff"  # transport & map symbols
-            "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-            "\U00002500-\U00002bef"  # chinese char
-            "\U00002702-\U000027b0"
-            "\U00002702-\U000027b0"
-            "\U000024c2-\U0001f251"
-            "\U0001f926-\U0001f937"
-            "\U00010000-\U0010ffff"
-            "\u2640-\u2642"
-            "\u2600-\u2b55"
-            "\u200d"
-            "\u23cf"
-            "\u23e9"
-            "\u231a"
-            "\ufe0f"  # dingbats
-            "\u3030"
-            "]+",
-            flags=re.UNICODE,
-        )
-
-        self.urlPattern = re.compile(
-            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-        )
-
-        self.mentionPattern = re.compile(r"@[A-Za-z0-9_]+")
-        self.hashtagPattern = re.compile(r"#[A-Za-z0-9_]+")
-
-        # Emoji to text mapping for sentiment context
-        self.emojiToText = {
-            "😀": "happy",
-            "😃": "happy",
-            "😄": "happy",
-            "😁": "happy",
-            "😆": "happy",
-            "😅": "happy",
-            "😂": "happy",
-            "😍": "love",
-            "😘": "love",
-            "😗": "love",
-            "😙": "love",
-            "😚": "love",
-            "😋": "happy",
-            "😎": "cool",
-            "😏": "smirk",
-            "😐": "neutral",
-            "😑": "neutral",
-            "😶": "neutral",
-            "😒": "annoyed",
-            "😔": "sad",
-            "😢": "sad",
-            "😭": "sad",
-            "😮": "surprised",
-            "😲": "surprised",
-            "😴": "tired",
-            "😪": "tired",
-            "😫": "tired",
-            "😌": "sleepy",
-            "😇": "peaceful",
-            "😜": "playful",
-            "😝": "playful",
-            "🤪": "crazy",
-            "😛": "playful",
-            "🤤": "greedy",
-            "🤭": "giggling",
-            "🤫": "quiet",
-            "🤥": "lying",
-            "😶‍🌫️": "speechless",
-            "😬": "grimace",
-            "😟": "frowning",
-            "😧": "anguished",
-            "😦": "astonished",
-            "🥺": "pleading",
-            "😿": "crying",
-            "😾": "crying",
-            "😠": "angry",
-            "😡": "angry",
-            "🤬": "angry",
-            "😤": "angry",
-            "🤯": "mind_blown",
-            "😳": "flushed",
-            "🥵": "hot",
-            "🥶": "cold",
-            "😱": "scared",
-            "😨": "fearful",
-            "😰": "anxious",
-            "😞": "downcast",
-            "🤷": "shrugging",
-            "🙅": "no_good",
-            "🙆": "ok_gesture",
-            "🙋": "raising_hand",
-            "🤦": "facepalm",
-            "💕": "love",
-            "💖": "love",
-            "💗": "love",
-            "💓": "love",
-            "💞": "love",
-            "💘": "love",
-            "💝": "love",
-            "💟": "love",
-            "❤": "love",
-            "🧡": "love",
-            "💛": "love",
-            "💚": "love",
-            "💙": "love",
-            "💜": "love",
-            "🖤": "love",
-            "🤍": "love",
-            "🤎": "love",
-            "💔": "broken_heart",
-            "❣": "love",
-            "💯": "perfect",
-            "💢": "angry",
-            "💥": "explosive",
-            "💫": "dizzy",
-            "💦": "sweat",
-            "💨": "dash",
-            "🔥": "fire",
-            "✨": "sparkles",
-            "⭐": "star",
-            "🌟": "star",
-            "💀": "skull",
-            "👻": "ghost",
-            "👍": "thumbs_up",
-            "👎": "thumbs_down",
-            "👌": "ok",
-            "✌": "peace",
-            "🤞": "crossed_fingers",
-            "🤟": "love_you",
-            "🤘": "rock_on",
-            "🤙": "call_me",
-            "👈": "pointing",
-            "👉": "pointing",
-            "👆": "pointing",
-            "👇": "pointing",
-            "☝": "pointing",
-            "✋": "hand",
-            "🤚": "hand",
-            "🖐": "hand",
-            "🖖": "vulcan",
-            "👋": "wave",
-            "🤏": "pinch",
-            "💪": "muscle",
-            "🦾": "muscle",
-            "🦿": "leg",
-            "🦵": "leg",
-            "🦶": "foot",
-            "👂": "ear",
-            "🦻": "ear",
-            "👃": "nose",
-            "🧠": "brain",
-            "🦷": "tooth",
-            "🦴": "bone",
-            "👀": "eyes",
-            "👁": "eye",
-            "👅": "tongue",
-        }
+        # Repeat analyses of the same text reuse the earlier processing result
+        self._processContent = functools.lru_cache(maxsize=512)(self._processContent)
 
         logger.info("Text processor initialized with emoji and pattern recognition")
 
@@ -217,177 +292,158 @@ class TextProcessor:
             ValidationError: If processing fails
         """
         try:
-            originalText = textInput.content
-
-            # Extract components before processing
-            extractedEmojis = self._extractEmojis(originalText)
-            extractedUrls = self._extractUrls(originalText)
-            extractedMentions = self._extractMentions(originalText)
-            extractedHashtags = self._extractHashtags(originalText)
-
-            # Process text step by step
-            processedText = self._normalizeUnicode(originalText)
-            processedText = self._convertEmojisToText(processedText)
-            processedText = self._removeUrls(processedText)
-            processedText = self._processMentionsAndHashtags(processedText)
-            processedText = self._cleanWhitespace(processedText)
-            processedText = self._normalizeText(processedText)
-
-            # Detect language (basic implementation)
-            detectedLanguage = self._detectLanguage(processedText)
-
-            # Calculate metrics
-            wordCount = len(processedText.split())
-            characterCount = len(processedText)
-
-            result = ProcessedText(
-                originalText=originalText,
-                processedText=processedText,
-                detectedLanguage=detectedLanguage,
-                extractedEmojis=extractedEmojis,
-                extractedUrls=extractedUrls,
-                extractedMentions=extractedMentions,
-                extractedHashtags=extractedHashtags,
-                wordCount=wordCount,
-                characterCount=characterCount,
-            )
-
-            logger.debug(
-                f"Processed text: {wordCount} words, {characterCount} chars, lang: {detectedLanguage}"
-            )
-            return result
+            return self._processContent(textInput.content)
 
         except Exception as e:
             logger.error(f"Text processing failed: {e}")
             raise ValidationError(f"Text processing failed: {e}", "text") from e
 
-    def _normalizeUnicode(self, text: str) -> str:
-        """Normalize unicode characters."""
-        return unicodedata.normalize("NFKD", text)
+    def clearCache(self) -> None:
+        """Drop memoized processing results."""
+        self._processContent.cache_clear()
+        logger.info("Text processing cache cleared")
 
-    def _extractEmojis(self, text: str) -> list[str]:
-        """Extract emojis from text."""
-        return self.emojiPattern.findall(text)
+    def _processContent(self, originalText: str) -> ProcessedText:
+        """
+        Run the processing pipeline on raw text.
 
-    def _extractUrls(self, text: str) -> list[str]:
-        """Extract URLs from text."""
-        return self.urlPattern.findall(text)
+        Memoized per instance; callers must treat the result as read-only.
 
-    def _extractMentions(self, text: str) -> list[str]:
-        """Extract mentions (@username) from text."""
-        return self.mentionPattern.findall(text)
+        Args:
+            originalText: Raw text content
 
-    def _extractHashtags(self, text: str) -> list[str]:
-        """Extract hashtags (#tag) from text."""
-        return self.hashtagPattern.findall(text)
+        Returns:
+            ProcessedText with analysis-ready content
+        """
+        # Extract components and rewrite them in a single scan
+        processedText = self._normalizeUnicode(originalText)
+        (
+            processedText,
+            extractedEmojis,
+            extractedUrls,
+            extractedMentions,
+            extractedHashtags,
+        ) = self._processTokens(processedText)
+        # Contraction expansion can add spaces, so collapse whitespace last
+        processedText = self._normalizeText(processedText)
+        processedText = self._cleanWhitespace(processedText)
+
+        # Split once for both language detection and the word count
+        words = processedText.split()
+
+        # Detect language (basic implementation)
+        detectedLanguage = self._detectLanguage(words)
+
+        # Calculate metrics
+        wordCount = len(words)
+        characterCount = len(processedText)
+
+        result = ProcessedText(
+            originalText=originalText,
+            processedText=processedText,
+            detectedLanguage=detectedLanguage,
+            extractedEmojis=extractedEmojis,
+            extractedUrls=extractedUrls,
+            extractedMentions=extractedMentions,
+            extractedHashtags=extractedHashtags,
+            wordCount=wordCount,
+            characterCount=characterCount,
+        )
 
-    def _convertEmojisToText(self, text: str) -> str:
-        """Convert emojis to descriptive text for better sentiment analysis."""
+        logger.debug(
+            f"Processed text: {wordCount} words, {characterCount} chars, lang: {detectedLanguage}"
+        )
+        return result
 
-        def emojiReplacer(match):
-            emoji = match.group(0)
-            return f" {self.emojiToText.get(emoji, 'emoji')} "
+    def _normalizeUnicode(self, text: str) -> str:
+        """Normalize unicode characters."""
+        # ASCII text is identical in every normalization form
+        if text.isascii():
+            return text
+        return unicodedata.normalize("NFKD", text)
 
-        return self.emojiPattern.sub(emojiReplacer, text)
+    def _processTokens(
+        self, text: str
+    ) -> tuple[str, list[str], list[str], list[str], list[str]]:
+        """
+        Extract and rewrite emojis, URLs, mentions and hashtags in one pass.
 
-    def _removeUrls(self, text: str) -> str:
-        """Remove URLs from text."""
-        return self.urlPattern.sub(" ", text)
+        Emojis become descriptive words, hashtags keep their word, and URLs
+        and mentions are dropped.
 
-    def _processMentionsAndHashtags(self, text: str) -> str:
-        """Process mentions and hashtags."""
-        # Convert hashtags to words (remove #)
-        text = self.hashtagPattern.sub(lambda m: m.group(0)[1:], text)
+        Args:
+            text: Unicode-normalized text
 
-        # Remove mentions
-        text = self.mentionPattern.sub(" ", text)
+        Returns:
+            Tuple of rewritten text and the extracted emojis, URLs, mentions
+            and hashtags
+        """
+        # Emojis are never ASCII, and URLs, mentions and hashtags all need one
+        # of these markers, so plain ASCII text skips the regex scan entirely
+        if text.isascii() and not any(marker in text for marker in _TOKEN_MARKERS):
+            return text, [], [], [], []
+
+        extracted: dict[str, list[str]] = {
+            "emoji": [],
+            "url": [],
+            "mention": [],
+            "hashtag": [],
+        }
 
-        return text
+        def tokenReplacer(match: re.Match[str]) -> str:
+            kind = match.lastgroup
+            token = match.group(0)
+            extracted[kind].append(token)
+            if kind == "emoji":
+                return _EMOJI_REPLACEMENTS.get(token, _UNKNOWN_EMOJI_TEXT)
+            if kind == "hashtag":
+                return token[1:]
+            return " "
+
+        text = _TOKEN_PATTERN.sub(tokenReplacer, text)
+        return (
+            text,
+            extracted["emoji"],
+            extracted["url"],
+            extracted["mention"],
+            extracted["hashtag"],
+        )
 
     def _cleanWhitespace(self, text: str) -> str:
         """Clean and normalize whitespace."""
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        # Collapse whitespace runs and trim both ends in one split/join
+        return " ".join(text.split())
 
     def _normalizeText(self, text: str) -> str:
         """Apply final text normalization."""
         # Convert to lowercase for consistency
         text = text.lower()
 
-        # Remove excessive punctuation
-        text = re.sub(r"[.]{2,}", ".", text)
-        text = re.sub(r"[!]{2,}", "!", text)
-        text = re.sub(r"[?]{2,}", "?", text)
-
-        # Normalize contractions for better analysis
-        contractions = {
-            "n't": " not",
-            "'re": " are",
-            "'ve": " have",
-            "'ll": " will",
-            "'d": " would",
-            "'m": " am",
-        }
-
-        for contraction, expansion in contractions.items():
-            text = text.replace(contraction, expansion)
-
-        return text
+        # Collapse repeated punctuation ("..." -> ".", "!!" -> "!", "??" -> "?")
+        # and expand contractions for better analysis
+        return _NORMALIZATION_PATTERN.sub(_normalizeToken, text)
 
-    def _detectLanguage(self, text: str) -> str:
+    def _detectLanguage(self, words: list[str]) -> str:
         """Basic language detection (English-focused for now)."""
-        # Simple heuristic - count English common words
-        englishWords = {
-            "the",
-            "and",
-            "is",
-            "in",
-            "to",
-            "of",
-            "a",
-            "that",
-            "it",
-            "with",
-            "for",
-            "as",
-            "was",
-            "on",
-            "are",
-            "you",
-            "this",
-            "be",
-            "at",
-            "have",
-            "not",
-            "or",
-            "from",
-            "by",
-            "they",
-            "we",
-            "can",
-            "an",
-            "your",
-            "all",
-            "but",
-            "will",
-            "one",
-            "would",
-            "there",
-            "their",
-        }
-
-        words = text.lower().split()
+        # Simple heuristic - more than 30% common English words; the words
+        # are already lowercased by _normalizeText
         if not words:
             return "unknown"
 
-        englishCount = sum(1 for word in words if word in englishWords)
-        englishRatio = englishCount / len(words)
-
-        if englishRatio > 0.3:
-            return "en"
-        else:
-            return "unknown"
+        # Smallest count for which englishCount / len(words) > 0.3
+        threshold = len(words) * 3 // 10 + 1
+        englishCount = 0
+        remaining = len(words)
+        for word in words:
+            remaining -= 1
+            if word in _ENGLISH_WORDS:
+                englishCount += 1
+                if englishCount >= threshold:
+                    return "en"
+            elif englishCount + remaining < threshold:
+                break
+
+        return "unknown"
 
     def batchProcess(self, textInputs: list[TextInput]) -> list[ProcessedText]:
         """
@@ -400,10 +456,18 @@ class TextProcessor:
             List of processed texts
         """
         results = []
+        # Identical texts in one batch share a single processing result
+        processedByContent: dict[str, ProcessedText] = {}
 
         for textInput in textInputs:
+            processed = processedByContent.get(textInput.content)
+            if processed is not None:
+                results.append(processed)
+                continue
+
             try:
                 processed = self.processText(textInput)
+                processedByContent[textInput.content] = processed
                 results.append(processed)
             except Exception as e:
                 logger.warning(f"Failed to process text: {e}")
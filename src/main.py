@@ -33,19 +33,21 @@ def main() -> None:
         logger.info("Starting Text Gauntlet v2.0.0")
         logger.info(f"Configuration loaded: {settings.ui.defaultTheme} theme")
 
-        # Initialize services
+        # Initialize services while the UI is imported and the window is built
         from services.application_services import services
 
-        services.initialize()
-        logger.info("Services initialized successfully")
+        services.initializeInBackground()
 
-        # Import UI components after services are set up
         from ui.main_window import TextGauntletApp
 
         # Create and run application
         app = TextGauntletApp()
         logger.info("Application initialized successfully")
 
+        # Pages are built once the main loop starts and need the services
+        services.waitUntilReady()
+        logger.info("Services initialized successfully")
+
         # Start the main loop
         app.run()
 
@@ -1,10 +1,11 @@
 """Main application service manager for Text Gauntlet Phase 4."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from config.settings import settings
-from core.models import TextInput
+from core.models import SentimentResult, TextInput
 from core.sentiment_analyzer import SentimentAnalyzer
 from utils.logger import logger
 
@@ -23,6 +24,8 @@ class ApplicationServices:
     def __init__(self) -> None:
         """Initialize all application services."""
         self._initialized = False
+        self._initThread: threading.Thread | None = None
+        self._initError: Exception | None = None
 
         # Core services
         self.sentimentAnalyzer: SentimentAnalyzer | None = None
@@ -48,8 +51,10 @@ class ApplicationServices:
         try:
             logger.info("Initializing application services...")
 
-            # Initialize core sentiment analyzer
+            # Initialize core sentiment analyzer and start loading its model
+            # while the window is being built
             self.sentimentAnalyzer = SentimentAnalyzer()
+            self.sentimentAnalyzer.loadModelInBackground()
 
             # Initialize data service
             dataPath = settings.getDataPath()
@@ -88,6 +93,38 @@ class ApplicationServices:
             logger.error(f"Failed to initialize services: {e}")
             raise
 
+    def initializeInBackground(self) -> None:
+        """Start initializing services on a daemon thread.
+
+        Callers must call waitUntilReady before using any service.
+        """
+
+        def initTask() -> None:
+            try:
+                self.initialize()
+            except Exception as e:
+                # Re-raised by waitUntilReady on the calling thread
+                self._initError = e
+
+        self._initThread = threading.Thread(
+            target=initTask, name="services-init", daemon=True
+        )
+        self._initThread.start()
+
+    def waitUntilReady(self) -> None:
+        """Wait for background initialization to finish.
+
+        Raises:
+            Exception: The error raised by background initialization, if any
+        """
+        if self._initThread is not None:
+            self._initThread.join()
+            self._initThread = None
+
+        if self._initError is not None:
+            error, self._initError = self._initError, None
+            raise error
+
     def shutdown(self) -> None:
         """Shutdown all services gracefully."""
         if not self._initialized:
@@ -102,6 +139,8 @@ class ApplicationServices:
         # Clear caches
         if self.apiManager:
             self.apiManager.clearCache()
+        if self.sentimentAnalyzer:
+            self.sentimentAnalyzer.textProcessor.clearCache()
 
         self._initialized = False
         logger.info("Application services shutdown complete")
@@ -152,6 +191,22 @@ class ApplicationServices:
             cache_key, lambda _: performAnalysis(text)
         )
 
+    def saveAnalysisResult(self, textInput: TextInput, result: SentimentResult) -> None:
+        """Save an already computed analysis result to history.
+
+        Lets callers that ran their own batched analysis record it without
+        running the model a second time.
+
+        Args:
+            textInput: Analyzed input
+            result: Analysis result for the input
+        """
+        if not self._initialized:
+            raise RuntimeError("Services not initialized")
+
+        if self.dataService:
+            self.dataService.saveAnalysisResult(textInput, result)
+
     def getAnalysisHistory(self, limit: int = 100, offset: int = 0) -> list[dict]:
         """Get analysis history.
 
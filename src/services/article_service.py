@@ -1,16 +1,18 @@
 """News and article analysis service using web scraping."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
 
 from core.models import TextInput
 from core.sentiment_analyzer import SentimentAnalyzer
 from utils.exceptions import ApiError, ValidationError
 from utils.logger import logger
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class ArticleService:
     """Service for fetching and analyzing news articles and web content."""
@@ -127,7 +129,9 @@ class ArticleService:
             if "text/html" not in contentType:
                 raise ApiError(f"URL does not contain HTML content: {contentType}")
 
-            # Parse HTML
+            # Parse HTML (bs4 is imported lazily to keep it off the startup path)
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(response.content, "html.parser")
 
             # Remove unwanted elements
@@ -155,7 +159,7 @@ class ArticleService:
             logger.error(f"Error processing article from {url}: {e}")
             raise ApiError(f"Failed to process article: {e}") from e
 
-    def _extractArticleContent(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _extractArticleContent(self, soup: "BeautifulSoup") -> dict[str, Any]:
         """Extract article content, title, and metadata from BeautifulSoup object.
 
         Args:
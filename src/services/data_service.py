@@ -1,6 +1,7 @@
 """Data persistence service for Text Gauntlet."""
 
 import json
+import os
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -353,12 +354,16 @@ class DataService:
             preferences: Dictionary of user preferences
         """
         try:
-            with open(self.prefsPath, "w") as f:
+            # Write to a sibling file and swap it in, so a crash mid-write
+            # never leaves a truncated preferences file behind
+            tempPath = self.prefsPath.with_suffix(".json.tmp")
+            with open(tempPath, "w") as f:
                 json.dump(preferences, f, indent=2)
+            os.replace(tempPath, self.prefsPath)
 
             logger.info("User preferences saved successfully")
 
-        except (OSError, json.JSONEncodeError) as e:
+        except (OSError, TypeError, ValueError) as e:
             logger.error(f"Failed to save user preferences: {e}")
             raise DataPersistenceError(f"Failed to save preferences: {e}") from e
 
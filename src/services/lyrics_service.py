@@ -1,9 +1,8 @@
 """Lyrics analysis service using Genius API."""
 
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import lyricsgenius
 import requests
 
 from config.settings import settings
@@ -11,6 +10,46 @@ from core.models import TextInput
 from utils.exceptions import ApiError, ValidationError
 from utils.logger import logger
 
+from .api_manager import AnalysisCache
+
+if TYPE_CHECKING:
+    from lyricsgenius import Genius
+
+# Artifacts LyricsGenius leaves around the lyrics, removed in this order
+_LYRICS_ARTIFACT_PATTERNS = (
+    # Contributor counts and metadata at the beginning
+    re.compile(r"^\d+\s*Contributors?.*?(?=\n|\r)", re.MULTILINE),
+    re.compile(r"^.*?Translations.*?(?=\n|\r)", re.MULTILINE),
+    re.compile(r"^.*?Türkçe.*?Deutsch.*?(?=\n|\r)", re.MULTILINE),
+    # Song descriptions and "Read More" content
+    re.compile(r"^.*?Read More.*?(?=\n|\r)", re.MULTILINE),
+    re.compile(r"^Written.*?(?=\n\n|\r\r)", re.DOTALL),
+    re.compile(r"^.*?entered the studio.*?(?=\n\n|\r\r)", re.DOTALL),
+    # Song title and description that appears before actual lyrics
+    re.compile(r'^.*?Lyrics.*?".*?" is not only.*?(?=\n\n|\r\r)', re.DOTALL),
+    re.compile(r'^.*?Lyrics.*?".*?" is .*?(?=\n\n|\r\r)', re.DOTALL),
+    # Embed/sharing info that sometimes appears at the end
+    re.compile(r"\d+Embed$"),
+    re.compile(r"You might also like.*$", re.DOTALL),
+    # Any remaining metadata patterns
+    re.compile(r"^.*?Contributors.*?$", re.MULTILINE),
+    re.compile(r"^.*?Translation.*?$", re.MULTILINE),
+)
+
+# Lines that are metadata rather than lyrics
+_METADATA_LINE_PATTERN = re.compile(
+    r"\d+\s*(?:Contributors?|Translations?)"
+    r"|(?:Türkçe|Português|Deutsch|English)"
+    r"|Written"
+    r"|.*entered the studio"
+)
+
+# Hints that a line is the start of the actual lyrics
+_LYRIC_LINE_PREFIXES = ("I'm ", "I ", "You ", "We ", "She ", "He ", "They ")
+_LYRIC_LINE_WORDS = ("feel", "love", "heart", "time", "know", "want", "need")
+
+_PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n\s*\n")
+
 
 class LyricsService:
     """Service for fetching and analyzing song lyrics."""
@@ -28,9 +67,31 @@ class LyricsService:
             "User-Agent": "TextGauntlet/2.0.0",
         }
 
-        # Initialize LyricsGenius client for lyrics extraction
-        if self.apiKey:
-            self.genius = lyricsgenius.Genius(
+        # Reuse one keep-alive connection pool for all Genius API calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+        # Genius lookups are slow and throttled, so keep recent songs around
+        self.lyricsCache = AnalysisCache(
+            maxSize=settings.cache.maxSize, ttlSeconds=settings.api.cacheExpiry
+        )
+
+        # LyricsGenius client, created on first use
+        self._genius: Genius | None = None
+
+        if not self.apiKey:
+            logger.warning(
+                "Genius API key not configured - lyrics service will be limited"
+            )
+
+    @property
+    def genius(self) -> "Genius | None":
+        """LyricsGenius client for lyrics extraction, or None without an API key."""
+        if self._genius is None and self.apiKey:
+            # lyricsgenius is imported lazily to keep it off the startup path
+            import lyricsgenius
+
+            self._genius = lyricsgenius.Genius(
                 self.apiKey,
                 verbose=False,  # Reduce logging
                 remove_section_headers=True,  # Clean up lyrics format
@@ -43,13 +104,9 @@ class LyricsService:
                 ],  # Skip remixes by default
                 timeout=15,  # Increase timeout for better reliability
             )
-            # Configure additional cleaning options
-            self.genius.response_format = "plain"  # Get plain text instead of formatted
-        else:
-            self.genius = None
-            logger.warning(
-                "Genius API key not configured - lyrics service will be limited"
-            )
+            # Configure additional cleaning options (plain text, not formatted)
+            self._genius.response_format = "plain"
+        return self._genius
 
     def searchSong(self, query: str) -> list[dict[str, Any]]:
         """Search for songs on Genius.
@@ -71,9 +128,8 @@ class LyricsService:
             raise ApiError("Genius API key not configured")
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/search",
-                headers=self.headers,
                 params={"q": query.strip()},
                 timeout=10,
             )
@@ -119,9 +175,8 @@ class LyricsService:
 
         try:
             # First get song details from the API
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/songs/{songId}",
-                headers=self.headers,
                 timeout=10,
             )
             response.raise_for_status()
@@ -180,40 +235,8 @@ class LyricsService:
             return ""
 
         # Remove common artifacts from LyricsGenius
-        # Remove contributor counts and metadata at the beginning
-        lyrics = re.sub(
-            r"^\d+\s*Contributors?.*?(?=\n|\r)", "", lyrics, flags=re.MULTILINE
-        )
-        lyrics = re.sub(r"^.*?Translations.*?(?=\n|\r)", "", lyrics, flags=re.MULTILINE)
-        lyrics = re.sub(
-            r"^.*?Türkçe.*?Deutsch.*?(?=\n|\r)", "", lyrics, flags=re.MULTILINE
-        )
-
-        # Remove song descriptions and "Read More" content
-        lyrics = re.sub(r"^.*?Read More.*?(?=\n|\r)", "", lyrics, flags=re.MULTILINE)
-        lyrics = re.sub(r"^Written.*?(?=\n\n|\r\r)", "", lyrics, flags=re.DOTALL)
-        lyrics = re.sub(
-            r"^.*?entered the studio.*?(?=\n\n|\r\r)", "", lyrics, flags=re.DOTALL
-        )
-
-        # Remove song title and description that appears before actual lyrics
-        lyrics = re.sub(
-            r'^.*?Lyrics.*?".*?" is not only.*?(?=\n\n|\r\r)',
-            "",
-            lyrics,
-            flags=re.DOTALL,
-        )
-        lyrics = re.sub(
-            r'^.*?Lyrics.*?".*?" is .*?(?=\n\n|\r\r)', "", lyrics, flags=re.DOTALL
-        )
-
-        # Remove embed/sharing info that sometimes appears at the end
-        lyrics = re.sub(r"\d+Embed$", "", lyrics)
-        lyrics = re.sub(r"You might also like.*$", "", lyrics, flags=re.DOTALL)
-
-        # Remove any remaining metadata patterns
-        lyrics = re.sub(r"^.*?Contributors.*?$", "", lyrics, flags=re.MULTILINE)
-        lyrics = re.sub(r"^.*?Translation.*?$", "", lyrics, flags=re.MULTILINE)
+        for pattern in _LYRICS_ARTIFACT_PATTERNS:
+            lyrics = pattern.sub("", lyrics)
 
         # Remove lines that are clearly metadata (contain URLs, special formatting, etc.)
         lines = lyrics.split("\n")
@@ -227,41 +250,23 @@ class LyricsService:
             if not line and not in_actual_lyrics:
                 continue
 
+            lowerLine = line.lower()
+
             # Skip lines that look like metadata or descriptions
             if (
                 line
-                and not re.match(r"^\d+\s*(Contributors?|Translations?)", line)
-                and not re.match(r"^(Türkçe|Português|Deutsch|English)", line)
-                and "genius.com" not in line.lower()
-                and "embed" not in line.lower()
+                and not _METADATA_LINE_PATTERN.match(line)
+                and "genius.com" not in lowerLine
+                and "embed" not in lowerLine
                 and not line.endswith("Lyrics")
                 and "Read More" not in line
-                and not re.match(r"^Written.*", line)
-                and not re.match(r"^.*entered the studio.*", line)
                 and len(line) > 1
             ):  # Skip very short lines that might be artifacts
                 # Check if this looks like actual song lyrics
                 # Lyrics typically start with "I" or have common lyrical patterns
                 if not in_actual_lyrics and (
-                    line.startswith("I'm ")
-                    or line.startswith("I ")
-                    or line.startswith("You ")
-                    or line.startswith("We ")
-                    or line.startswith("She ")
-                    or line.startswith("He ")
-                    or line.startswith("They ")
-                    or any(
-                        word in line.lower()
-                        for word in [
-                            "feel",
-                            "love",
-                            "heart",
-                            "time",
-                            "know",
-                            "want",
-                            "need",
-                        ]
-                    )
+                    line.startswith(_LYRIC_LINE_PREFIXES)
+                    or any(word in lowerLine for word in _LYRIC_LINE_WORDS)
                 ):
                     in_actual_lyrics = True
 
@@ -270,8 +275,8 @@ class LyricsService:
 
         lyrics = "\n".join(cleaned_lines)
 
-        # Remove extra whitespace and normalize
-        lyrics = re.sub(r"\n\s*\n\s*\n", "\n\n", lyrics)  # Normalize paragraph breaks
+        # Remove extra whitespace and normalize paragraph breaks
+        lyrics = _PARAGRAPH_BREAK_PATTERN.sub("\n\n", lyrics)
         lyrics = lyrics.strip()
 
         return lyrics
@@ -296,6 +301,13 @@ class LyricsService:
         if not self.genius:
             raise ApiError("Genius API key not configured")
 
+        cacheKey = f"{artist.strip().lower()}\n{songTitle.strip().lower()}"
+        if settings.cache.enabled:
+            cachedResult = self.lyricsCache.get(cacheKey)
+            if cachedResult is not None:
+                logger.info(f"Using cached lyrics for '{songTitle}' by {artist}")
+                return cachedResult
+
         try:
             # Use LyricsGenius to search and get lyrics directly
             logger.info(f"Searching for '{songTitle}' by {artist}")
@@ -337,7 +349,7 @@ class LyricsService:
 
             logger.info(f"Successfully analyzed lyrics for '{songTitle}' by {artist}")
 
-            return {
+            result = {
                 "song_info": song_info,
                 "lyrics": lyrics,
                 "text_input": textInput,
@@ -345,6 +357,11 @@ class LyricsService:
                 "character_count": textInput.length,
             }
 
+            if settings.cache.enabled:
+                self.lyricsCache.put(cacheKey, result)
+
+            return result
+
         except Exception as e:
             logger.error(f"Failed to analyze lyrics for {artist} - {songTitle}: {e}")
             raise ApiError(f"Failed to analyze song lyrics: {e}") from e
@@ -367,9 +384,8 @@ class LyricsService:
 
         try:
             # Search for the artist first
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/search",
-                headers=self.headers,
                 params={"q": artistName},
                 timeout=10,
             )
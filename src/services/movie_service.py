@@ -11,6 +11,8 @@ from core.sentiment_analyzer import SentimentAnalyzer
 from utils.exceptions import ApiError, ValidationError
 from utils.logger import logger
 
+from .api_manager import AnalysisCache
+
 
 class MovieService:
     """Service for fetching and analyzing movie reviews."""
@@ -28,9 +30,18 @@ class MovieService:
             "User-Agent": "TextGauntlet/2.0.0",
         }
 
+        # Reuse one keep-alive connection pool for all TMDB calls
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.headers["User-Agent"]})
+
         # Initialize sentiment analyzer
         self.analyzer = SentimentAnalyzer()
 
+        # TMDB responses change rarely, so repeat lookups are served from memory
+        self.responseCache = AnalysisCache(
+            maxSize=settings.cache.maxSize, ttlSeconds=settings.api.cacheExpiry
+        )
+
         if not self.apiKey:
             logger.warning(
                 "TMDB API key not configured - movie service will be limited"
@@ -55,8 +66,13 @@ class MovieService:
         if not self.apiKey:
             raise ApiError("TMDB API key not configured")
 
+        cacheKey = f"search:{query.strip().lower()}"
+        cachedResults = self._getCached(cacheKey)
+        if cachedResults is not None:
+            return cachedResults
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/search/movie",
                 params={
                     "api_key": self.apiKey,
@@ -87,6 +103,7 @@ class MovieService:
                 )
 
             logger.info(f"Found {len(results)} movies for query: {query}")
+            self._putCached(cacheKey, results)
             return results
 
         except requests.RequestException as e:
@@ -109,13 +126,18 @@ class MovieService:
         if not self.apiKey:
             raise ApiError("TMDB API key not configured")
 
+        cacheKey = f"reviews:{movieId}:{limit}"
+        cachedReviews = self._getCached(cacheKey)
+        if cachedReviews is not None:
+            return cachedReviews
+
         try:
             reviews = []
             page = 1
             maxPages = 5  # Limit to 5 pages to avoid excessive requests
 
             while len(reviews) < limit and page <= maxPages:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.baseUrl}/movie/{movieId}/reviews",
                     params={
                         "api_key": self.apiKey,
@@ -151,6 +173,7 @@ class MovieService:
                 page += 1
 
             logger.info(f"Retrieved {len(reviews)} reviews for movie ID: {movieId}")
+            self._putCached(cacheKey, reviews)
             return reviews
 
         except requests.RequestException as e:
@@ -172,8 +195,13 @@ class MovieService:
         if not self.apiKey:
             raise ApiError("TMDB API key not configured")
 
+        cacheKey = f"details:{movieId}"
+        cachedDetails = self._getCached(cacheKey)
+        if cachedDetails is not None:
+            return cachedDetails
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/movie/{movieId}",
                 params={
                     "api_key": self.apiKey,
@@ -185,7 +213,7 @@ class MovieService:
 
             movie = response.json()
 
-            return {
+            details = {
                 "id": movie.get("id"),
                 "title": movie.get("title", "Unknown"),
                 "tagline": movie.get("tagline", ""),
@@ -206,11 +234,36 @@ class MovieService:
                 "homepage": movie.get("homepage"),
                 "imdb_id": movie.get("imdb_id"),
             }
+            self._putCached(cacheKey, details)
+            return details
 
         except requests.RequestException as e:
             logger.error(f"Failed to get movie details for {movieId}: {e}")
             raise ApiError(f"Failed to retrieve movie details: {e}") from e
 
+    def _getCached(self, cacheKey: str) -> Any | None:
+        """Return a cached TMDB response, or None on a miss or when disabled.
+
+        Args:
+            cacheKey: Key identifying the request
+
+        Returns:
+            Cached response data or None
+        """
+        if not settings.cache.enabled:
+            return None
+        return self.responseCache.get(cacheKey)
+
+    def _putCached(self, cacheKey: str, data: Any) -> None:
+        """Store a TMDB response in the cache when caching is enabled.
+
+        Args:
+            cacheKey: Key identifying the request
+            data: Response data to cache
+        """
+        if settings.cache.enabled:
+            self.responseCache.put(cacheKey, data)
+
     def analyzeMovieReviews(
         self, movieTitle: str, maxReviews: int = 20
     ) -> dict[str, Any]:
@@ -277,12 +330,17 @@ class MovieService:
                 },
             )
 
-            # Perform sentiment analysis
+            # Perform sentiment analysis, scoring each review separately
             logger.info(f"Analyzing sentiment for {len(reviews)} reviews...")
+            analysisFallback = False
             try:
-                analysis_results = self.analyzer.analyzeText(textInput)
+                analysis_results = self.analyzer.analyzeSegments(
+                    textInput,
+                    [review["content"] for review in reviews if review["content"]],
+                )
             except Exception as sentiment_error:
                 logger.warning(f"Sentiment analysis failed: {sentiment_error}")
+                analysisFallback = True
                 # Provide fallback results
                 from core.models import SentimentResult, SentimentScore
 
@@ -330,6 +388,7 @@ class MovieService:
                     score.label: score.score for score in analysis_results.topEmotions
                 },
                 "analysis_results": analysis_results,
+                "analysis_fallback": analysisFallback,
             }
 
         except Exception as e:
@@ -368,7 +427,7 @@ class MovieService:
             return []
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/trending/movie/{timeWindow}",
                 params={"api_key": self.apiKey},
                 timeout=10,
@@ -412,7 +471,7 @@ class MovieService:
             return []
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.baseUrl}/movie/popular",
                 params={
                     "api_key": self.apiKey,
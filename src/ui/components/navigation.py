@@ -28,6 +28,10 @@ class NavigationSidebar(ctk.CTkFrame):
         self.currentPage = None  # Start with no page selected
         self.navigationButtons: dict[str, ctk.CTkButton] = {}
 
+        # Button fonts are shared so page switches don't allocate new fonts
+        self._normalFont = ctk.CTkFont(size=14, weight="normal")
+        self._selectedFont = ctk.CTkFont(size=14, weight="bold")
+
         self._setupSidebar()
 
     def _setupSidebar(self) -> None:
@@ -88,7 +92,7 @@ class NavigationSidebar(ctk.CTkFrame):
         button = ctk.CTkButton(
             self,
             text=title,
-            font=ctk.CTkFont(size=14, weight="normal"),
+            font=self._normalFont,
             height=48,
             corner_radius=12,
             anchor="w",
@@ -135,30 +139,41 @@ class NavigationSidebar(ctk.CTkFrame):
         if pageId == self.currentPage:
             return
 
-        # Update button styles
-        for btnPageId, button in self.navigationButtons.items():
-            if btnPageId == pageId:
-                # Selected state with enhanced styling - using theme colors
-                button.configure(
-                    fg_color=themeManager.getColor("primary"),
-                    text_color=themeManager.getColor("on_primary"),
-                    hover_color=themeManager.getColor("primary_variant"),
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    border_width=0,
-                )
-            else:
-                # Unselected state with better contrast
-                button.configure(
-                    fg_color="transparent",
-                    text_color=themeManager.getColor("text_primary"),
-                    hover_color=themeManager.getColor("surface_hover"),
-                    font=ctk.CTkFont(size=14, weight="normal"),
-                    border_width=0,
-                )
+        # Only the previously selected and newly selected buttons change style
+        previousButton = self.navigationButtons.get(self.currentPage)
+        if previousButton is not None:
+            self._styleButton(previousButton, selected=False)
+        self._styleButton(self.navigationButtons[pageId], selected=True)
 
         self.currentPage = pageId
         self.onPageChanged(pageId)
 
+    def _styleButton(self, button: ctk.CTkButton, selected: bool) -> None:
+        """Apply the selected or unselected style to a navigation button.
+
+        Args:
+            button: Navigation button to style
+            selected: Whether the button's page is the current page
+        """
+        if selected:
+            # Selected state with enhanced styling - using theme colors
+            button.configure(
+                fg_color=themeManager.getColor("primary"),
+                text_color=themeManager.getColor("on_primary"),
+                hover_color=themeManager.getColor("primary_variant"),
+                font=self._selectedFont,
+                border_width=0,
+            )
+        else:
+            # Unselected state with better contrast
+            button.configure(
+                fg_color="transparent",
+                text_color=themeManager.getColor("text_primary"),
+                hover_color=themeManager.getColor("surface_hover"),
+                font=self._normalFont,
+                border_width=0,
+            )
+
     def getCurrentPage(self) -> str:
         """Get the currently selected page.
 
@@ -206,6 +221,7 @@ class PageFrame(ctk.CTkFrame):
         """
         super().__init__(parent, **kwargs)
         self.isInitialized = False
+        self._fieldLabelFont: ctk.CTkFont | None = None
 
     def initialize(self) -> None:
         """Initialize the page (called when first shown)."""
@@ -228,3 +244,33 @@ class PageFrame(ctk.CTkFrame):
     def refresh(self) -> None:
         """Refresh the page content."""
         pass
+
+    def _createFieldLabel(
+        self,
+        parent: ctk.CTkFrame,
+        text: str,
+        row: int,
+        column: int = 0,
+        **gridKwargs: Any,
+    ) -> ctk.CTkLabel:
+        """Create a bold caption label in a label/value grid.
+
+        All captions on a page share one font object instead of each
+        creating its own Tk named font.
+
+        Args:
+            parent: Frame holding the label/value grid
+            text: Caption text
+            row: Grid row for the caption
+            column: Grid column for the caption
+            **gridKwargs: Extra grid options such as sticky or pady
+
+        Returns:
+            The created label
+        """
+        if self._fieldLabelFont is None:
+            self._fieldLabelFont = ctk.CTkFont(weight="bold")
+
+        label = ctk.CTkLabel(parent, text=text, font=self._fieldLabelFont)
+        label.grid(row=row, column=column, **gridKwargs)
+        return label
@@ -1,7 +1,6 @@
 """Advanced theme management system for Text Gauntlet."""
 
 import json
-import tempfile
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -11,6 +10,12 @@ import customtkinter as ctk
 from config.settings import settings
 from utils.logger import logger
 
+# Theme names that only switch the appearance mode, mapped to the CTk mode name
+_APPEARANCE_MODE_THEMES = {"system": "System", "light": "Light", "dark": "Dark"}
+
+# Color themes bundled with customtkinter
+_BUILTIN_THEMES = ("blue", "green", "dark-blue")
+
 
 class ThemeManager:
     """Advanced theme management with dynamic switching and customization."""
@@ -18,8 +23,13 @@ class ThemeManager:
     def __init__(self) -> None:
         """Initialize theme manager."""
         self.currentTheme = "system"
+        # Theme last applied through setTheme; None until the first call
+        self._appliedTheme: str | None = None
         self.customThemes: dict[str, dict[str, Any]] = {}
+        self.customThemePaths: dict[str, Path] = {}
         self.themeChangeCallbacks: list[Callable[[str], None]] = []
+        # Resolved colors keyed by (theme, appearance mode, color name)
+        self._colorCache: dict[tuple[str, str, str], str] = {}
         self._loadCustomThemes()
 
     def _loadCustomThemes(self) -> None:
@@ -36,6 +46,7 @@ class ThemeManager:
                         themeData = json.load(f)
                         themeName = themeFile.stem.lower()
                         self.customThemes[themeName] = themeData
+                        self.customThemePaths[themeName] = themeFile
                         logger.info(f"Loaded custom theme: {themeName}")
                 except Exception as e:
                     logger.error(f"Failed to load theme {themeFile}: {e}")
@@ -45,34 +56,34 @@ class ThemeManager:
 
     def getAvailableThemes(self) -> list[str]:
         """Get list of available themes."""
-        builtinThemes = ["blue", "green", "dark-blue"]
-        customThemes = list(self.customThemes.keys())
-        return ["system"] + builtinThemes + customThemes
+        return ["system", *_BUILTIN_THEMES, *self.customThemes]
 
     def setTheme(self, themeName: str) -> bool:
         """Set the current theme."""
         try:
-            themeName = themeName.lower()
+            themeName = themeName.strip().lower()
+
+            # Re-applying makes CTk re-read the theme file and re-notifies
+            if themeName == self._appliedTheme:
+                return True
 
             # Handle appearance mode
-            if themeName == "system":
-                ctk.set_appearance_mode("System")
+            appearanceMode = _APPEARANCE_MODE_THEMES.get(themeName)
+            if appearanceMode is not None:
+                ctk.set_appearance_mode(appearanceMode)
                 ctk.set_default_color_theme("blue")
-            elif themeName in ["light", "dark"]:
-                ctk.set_appearance_mode(themeName.title())
-                ctk.set_default_color_theme("blue")
-            elif themeName in ["blue", "green", "dark-blue"]:
+            elif themeName in _BUILTIN_THEMES:
                 # Built-in themes
                 ctk.set_default_color_theme(themeName)
             elif themeName in self.customThemes:
                 # Custom theme
-                themeData = self.customThemes[themeName]
-                self._applyCustomTheme(themeData)
+                self._applyCustomTheme(themeName)
             else:
                 logger.warning(f"Unknown theme: {themeName}")
                 return False
 
             self.currentTheme = themeName
+            self._appliedTheme = themeName
             self._notifyThemeChange(themeName)
             logger.info(f"Theme changed to: {themeName}")
             return True
@@ -81,25 +92,15 @@ class ThemeManager:
             logger.error(f"Failed to set theme {themeName}: {e}")
             return False
 
-    def _applyCustomTheme(self, themeData: dict[str, Any]) -> None:
+    def _applyCustomTheme(self, themeName: str) -> None:
         """Apply a custom theme configuration."""
         try:
             # Set appearance mode before applying theme
-            appearance_mode = self._detectAppearanceMode(themeData)
+            appearance_mode = self._detectAppearanceMode(self.customThemes[themeName])
             ctk.set_appearance_mode(appearance_mode)
 
-            # Create a temporary file for the theme data
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False, encoding="utf-8"
-            ) as temp_file:
-                json.dump(themeData, temp_file, indent=2)
-                temp_file_path = temp_file.name
-
-            try:
-                ctk.set_default_color_theme(temp_file_path)
-            finally:
-                # Clean up the temporary file immediately after use
-                Path(temp_file_path).unlink(missing_ok=True)
+            # The theme was loaded from this file, so CTk can read it directly
+            ctk.set_default_color_theme(str(self.customThemePaths[themeName]))
 
         except Exception as e:
             logger.error(f"Failed to apply custom theme: {e}")
@@ -229,6 +230,16 @@ class ThemeManager:
         Returns:
             Color value as a string
         """
+        # Dark-mode variants of custom themes depend on the appearance mode
+        cacheKey = (self.currentTheme, ctk.get_appearance_mode(), colorName)
+        color = self._colorCache.get(cacheKey)
+        if color is None:
+            color = self._resolveColor(colorName)
+            self._colorCache[cacheKey] = color
+        return color
+
+    def _resolveColor(self, colorName: str) -> str:
+        """Look up a color in the current theme without caching."""
         try:
             # For custom themes like Oblivion, extract from theme data first
             if self.currentTheme in self.customThemes:
@@ -1,5 +1,7 @@
 """Main window for Text Gauntlet application."""
 
+from collections.abc import Callable
+
 import customtkinter as ctk
 
 from config.settings import settings
@@ -30,6 +32,7 @@ class TextGauntletApp:
         self.navigationSidebar: NavigationSidebar | None = None
         self.currentPage: str = "text"
         self.pages: dict[str, ctk.CTkFrame] = {}
+        self.pageFactories: dict[str, Callable[[], ctk.CTkFrame]] = {}
         self.contentFrame: ctk.CTkFrame | None = None
 
         self._setupUI()
@@ -46,11 +49,9 @@ class TextGauntletApp:
             # Create navigation and content areas
             self._createLayout()
 
-            # Initialize pages
-            self._initializePages()
-
-            # Show initial page
-            self._showPage("text")
+            # Build pages once the main loop is running so the window and
+            # sidebar can paint before any page widgets are constructed
+            self.window.after_idle(self._initializeContent)
 
             logger.info("UI setup completed successfully")
 
@@ -134,58 +135,95 @@ class TextGauntletApp:
         self.contentFrame.grid_rowconfigure(0, weight=1)
         self.contentFrame.grid_columnconfigure(0, weight=1)
 
+    def _initializeContent(self) -> None:
+        """Initialize pages and show the initial page."""
+        try:
+            # Initialize pages
+            self._initializePages()
+
+            # Show initial page
+            self._showPage("text")
+
+        except ConfigurationError as e:
+            logger.error(f"Failed to initialize content: {e.message}")
+
     def _initializePages(self) -> None:
-        """Initialize all application pages."""
+        """Register the application pages; each is built on first visit."""
         if not self.contentFrame:
             raise ConfigurationError("Content frame not initialized")
 
-        try:
+        self.pageFactories = {
             # Text analysis page
-            self.pages["text"] = TextPage(self.contentFrame, fg_color="transparent")
-
+            "text": lambda: TextPage(self.contentFrame, fg_color="transparent"),
             # Lyrics analysis page
-            self.pages["lyrics"] = LyricsPage(
+            "lyrics": lambda: LyricsPage(
                 self.contentFrame, services.lyricsService, fg_color="transparent"
-            )
-
+            ),
             # Movies analysis page
-            self.pages["movies"] = MoviesPage(
+            "movies": lambda: MoviesPage(
                 self.contentFrame, services.movieService, fg_color="transparent"
-            )
-
+            ),
             # Articles analysis page
-            self.pages["articles"] = ArticlesPage(
+            "articles": lambda: ArticlesPage(
                 self.contentFrame, services.articleService, fg_color="transparent"
-            )
-
+            ),
             # History page
-            self.pages["history"] = HistoryPage(
+            "history": lambda: HistoryPage(
                 self.contentFrame, services.dataService, fg_color="transparent"
-            )
-
+            ),
             # Settings page
-            self.pages["settings"] = SettingsPage(
+            "settings": lambda: SettingsPage(
                 self.contentFrame, settings, fg_color="transparent"
-            )
+            ),
+        }
+
+    def _getPage(self, pageName: str) -> ctk.CTkFrame | None:
+        """Return a page, building it the first time it is requested.
 
-            # Grid all pages (initially hidden)
-            for page in self.pages.values():
-                page.grid(row=0, column=0, sticky="nsew")
-                page.grid_remove()
+        Args:
+            pageName: Name of the page
 
-            logger.info("All pages initialized successfully")
+        Returns:
+            Page frame, or None for an unknown page name
+
+        Raises:
+            ConfigurationError: If the page fails to build
+        """
+        page = self.pages.get(pageName)
+        if page is not None or pageName not in self.pageFactories:
+            return page
+
+        try:
+            page = self.pageFactories[pageName]()
+
+            # Grid the page (initially hidden)
+            page.grid(row=0, column=0, sticky="nsew")
+            page.grid_remove()
 
         except Exception as e:
-            logger.error(f"Failed to initialize pages: {e}")
+            logger.error(f"Failed to initialize {pageName} page: {e}")
             raise ConfigurationError(f"Page initialization failed: {e}") from e
 
+        self.pages[pageName] = page
+        logger.debug(f"Initialized {pageName} page")
+        return page
+
     def _onPageChanged(self, pageName: str) -> None:
         """Handle page change from navigation."""
         self._showPage(pageName)
 
     def _showPage(self, pageName: str) -> None:
         """Show the specified page and hide others."""
-        if pageName not in self.pages:
+        # The current page is already gridded once it has been built
+        if pageName == self.currentPage and pageName in self.pages:
+            return
+
+        try:
+            page = self._getPage(pageName)
+        except ConfigurationError as e:
+            logger.error(f"Cannot show {pageName} page: {e.message}")
+            return
+        if page is None:
             return
 
         # Hide current page
@@ -196,10 +234,10 @@ class TextGauntletApp:
                 self.pages[self.currentPage].onHide()
 
         # Show new page
-        self.pages[pageName].grid()
+        page.grid()
         # Call onShow to initialize the page
-        if hasattr(self.pages[pageName], "onShow"):
-            self.pages[pageName].onShow()
+        if hasattr(page, "onShow"):
+            page.onShow()
         self.currentPage = pageName
 
         # Update navigation sidebar
@@ -209,10 +247,10 @@ class TextGauntletApp:
         # Special handling for certain pages
         if pageName == "history":
             # Refresh history when switching to history page
-            if hasattr(self.pages[pageName], "refresh"):
-                self.pages[pageName].refresh()
+            if hasattr(page, "refresh"):
+                page.refresh()
 
-        logger.info(f"Switched to {pageName} page")
+        logger.debug(f"Switched to {pageName} page")
 
     def run(self) -> None:
         """Run the application."""
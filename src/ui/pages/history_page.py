@@ -8,6 +8,7 @@ import customtkinter as ctk
 from services.data_service import DataService
 from ui.components.base import ActionButton, Card, ScrollableFrame, StatusIndicator
 from ui.components.theme_manager import themeManager
+from utils.helpers import UIHelper
 from utils.logger import logger
 
 
@@ -77,8 +78,7 @@ class HistoryPage(ctk.CTkFrame):
             self.controlsCard.contentFrame, fg_color="transparent"
         )
         controlsFrame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
-        controlsFrame.grid_columnconfigure(0, weight=1)
-        controlsFrame.grid_columnconfigure(1, weight=1)
+        controlsFrame.grid_columnconfigure((0, 1), weight=1)
 
         # Refresh button
         self.refreshButton = ActionButton(
@@ -349,14 +349,10 @@ class HistoryPage(ctk.CTkFrame):
         # Create confirmation dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Clear History")
-        dialog.geometry("400x200")
         dialog.transient(self.winfo_toplevel())
 
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (200 // 2)
-        dialog.geometry(f"400x200+{x}+{y}")
+        UIHelper.centerWindow(dialog, 400, 200)
 
         # Wait for dialog to be visible before grabbing
         dialog.after(100, lambda: dialog.grab_set())
@@ -385,8 +381,7 @@ class HistoryPage(ctk.CTkFrame):
         # Buttons frame
         buttonsFrame = ctk.CTkFrame(contentFrame, fg_color="transparent")
         buttonsFrame.pack(fill="x")
-        buttonsFrame.grid_columnconfigure(0, weight=1)
-        buttonsFrame.grid_columnconfigure(1, weight=1)
+        buttonsFrame.grid_columnconfigure((0, 1), weight=1)
 
         # Cancel button
         cancelButton = ctk.CTkButton(
@@ -119,24 +119,15 @@ class LyricsPage(PageFrame):
         # Input grid
         inputFrame = ctk.CTkFrame(self.searchCard.contentFrame, fg_color="transparent")
         inputFrame.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
-        inputFrame.grid_columnconfigure(0, weight=1)
-        inputFrame.grid_columnconfigure(1, weight=1)
+        inputFrame.grid_columnconfigure((0, 1), weight=1)
 
-        # Artist input
-        ctk.CTkLabel(inputFrame, text="Artist:", font=ctk.CTkFont(weight="bold")).grid(
-            row=0, column=0, sticky="w", pady=(0, 5)
+        # Artist and song inputs
+        self.artistInput = self._createLabeledInput(
+            inputFrame, 0, "Artist:", "Enter artist name...", padx=(0, 10)
+        )
+        self.songInput = self._createLabeledInput(
+            inputFrame, 1, "Song Title:", "Enter song title..."
         )
-
-        self.artistInput = InputField(inputFrame, placeholder="Enter artist name...")
-        self.artistInput.grid(row=1, column=0, sticky="ew", padx=(0, 10), pady=(0, 10))
-
-        # Song input
-        ctk.CTkLabel(
-            inputFrame, text="Song Title:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=0, column=1, sticky="w", pady=(0, 5))
-
-        self.songInput = InputField(inputFrame, placeholder="Enter song title...")
-        self.songInput.grid(row=1, column=1, sticky="ew", pady=(0, 10))
 
         # Button frame
         buttonFrame = ctk.CTkFrame(self.searchCard.contentFrame, fg_color="transparent")
@@ -153,6 +144,34 @@ class LyricsPage(PageFrame):
         self.statusIndicator = StatusIndicator(buttonFrame)
         self.statusIndicator.grid(row=0, column=1, padx=(10, 0))
 
+    def _createLabeledInput(
+        self,
+        parent: ctk.CTkFrame,
+        column: int,
+        labelText: str,
+        placeholder: str,
+        padx: int | tuple[int, int] = 0,
+    ) -> InputField:
+        """Create a bold label with an input field below it.
+
+        Args:
+            parent: Frame to place the label and input in
+            column: Grid column shared by the label and input
+            labelText: Text shown above the input
+            placeholder: Placeholder text for the input
+            padx: Horizontal padding for the input
+
+        Returns:
+            The created input field
+        """
+        self._createFieldLabel(
+            parent, labelText, 0, column=column, sticky="w", pady=(0, 5)
+        )
+
+        inputField = InputField(parent, placeholder=placeholder)
+        inputField.grid(row=1, column=column, sticky="ew", padx=padx, pady=(0, 10))
+        return inputField
+
     def _createResultsSection(self) -> None:
         """Create the results display section."""
         # Create a scrollable results area
@@ -186,9 +205,7 @@ class LyricsPage(PageFrame):
         infoFrame.grid_columnconfigure(1, weight=1)
 
         # Song title
-        ctk.CTkLabel(infoFrame, text="Song:", font=ctk.CTkFont(weight="bold")).grid(
-            row=0, column=0, sticky="w", pady=(0, 5)
-        )
+        self._createFieldLabel(infoFrame, "Song:", 0, sticky="w", pady=(0, 5))
 
         self.songTitleLabel = ctk.CTkLabel(
             infoFrame,
@@ -198,9 +215,7 @@ class LyricsPage(PageFrame):
         self.songTitleLabel.grid(row=0, column=1, sticky="w", padx=(10, 0), pady=(0, 5))
 
         # Artist
-        ctk.CTkLabel(infoFrame, text="Artist:", font=ctk.CTkFont(weight="bold")).grid(
-            row=1, column=0, sticky="w", pady=(0, 5)
-        )
+        self._createFieldLabel(infoFrame, "Artist:", 1, sticky="w", pady=(0, 5))
 
         self.artistLabel = ctk.CTkLabel(
             infoFrame,
@@ -210,9 +225,7 @@ class LyricsPage(PageFrame):
         self.artistLabel.grid(row=1, column=1, sticky="w", padx=(10, 0), pady=(0, 5))
 
         # Word count
-        ctk.CTkLabel(
-            infoFrame, text="Word Count:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=2, column=0, sticky="w", pady=(0, 10))
+        self._createFieldLabel(infoFrame, "Word Count:", 2, sticky="w", pady=(0, 10))
 
         self.wordCountLabel = ctk.CTkLabel(
             infoFrame, text="N/A", text_color=themeManager.getColor("text_secondary")
@@ -222,9 +235,9 @@ class LyricsPage(PageFrame):
         )
 
         # Lyrics preview
-        ctk.CTkLabel(
-            infoFrame, text="Lyrics Preview:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=3, column=0, sticky="nw", pady=(0, 5))
+        self._createFieldLabel(
+            infoFrame, "Lyrics Preview:", 3, sticky="nw", pady=(0, 5)
+        )
 
         self.lyricsPreview = ctk.CTkTextbox(
             infoFrame, height=80, wrap="word", state="disabled"
@@ -240,9 +253,9 @@ class LyricsPage(PageFrame):
         resultsFrame.grid_columnconfigure(1, weight=1)
 
         # Primary result
-        ctk.CTkLabel(
-            resultsFrame, text="Primary Sentiment:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=0, column=0, sticky="w", pady=(0, 10))
+        self._createFieldLabel(
+            resultsFrame, "Primary Sentiment:", 0, sticky="w", pady=(0, 10)
+        )
 
         self.primaryResultLabel = ctk.CTkLabel(
             resultsFrame,
@@ -254,9 +267,7 @@ class LyricsPage(PageFrame):
         )
 
         # Confidence score
-        ctk.CTkLabel(
-            resultsFrame, text="Confidence:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=1, column=0, sticky="w", pady=(0, 10))
+        self._createFieldLabel(resultsFrame, "Confidence:", 1, sticky="w", pady=(0, 10))
 
         self.confidenceLabel = ctk.CTkLabel(
             resultsFrame, text="N/A", text_color=themeManager.getColor("text_secondary")
@@ -266,9 +277,9 @@ class LyricsPage(PageFrame):
         )
 
         # Detailed scores
-        ctk.CTkLabel(
-            resultsFrame, text="Detailed Scores:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=2, column=0, sticky="nw", pady=(0, 10))
+        self._createFieldLabel(
+            resultsFrame, "Detailed Scores:", 2, sticky="nw", pady=(0, 10)
+        )
 
         self.scoresLabel = ctk.CTkLabel(
             resultsFrame,
@@ -279,9 +290,7 @@ class LyricsPage(PageFrame):
         self.scoresLabel.grid(row=2, column=1, sticky="nw", padx=(10, 0), pady=(0, 10))
 
         # Processing time
-        ctk.CTkLabel(
-            resultsFrame, text="Processing Time:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=3, column=0, sticky="w")
+        self._createFieldLabel(resultsFrame, "Processing Time:", 3, sticky="w")
 
         self.timingLabel = ctk.CTkLabel(
             resultsFrame, text="N/A", text_color=themeManager.getColor("text_secondary")
@@ -391,12 +400,7 @@ class LyricsPage(PageFrame):
             # Update detailed scores
             scores = analysis.get("scores", [])
             if scores:
-                scoresText = "\n".join(
-                    [
-                        f"{score['label'].title()}: {score['score']:.1%}"
-                        for score in scores[:5]  # Show top 5 scores
-                    ]
-                )
+                scoresText = UIHelper.formatTopScores(scores, topN=5)
             else:
                 scoresText = "No detailed scores available"
 
@@ -384,7 +384,7 @@ class MoviesPage(ctk.CTkFrame):
 
         # Make sure the analyze button is visible and properly positioned
         self.analyzeButton.grid(row=1, column=0, padx=20, pady=(10, 20), sticky="ew")
-        logger.info(
+        logger.debug(
             f"Analyze button positioned for movie: {movie.get('title', 'Unknown')}"
         )
 
@@ -404,13 +404,11 @@ class MoviesPage(ctk.CTkFrame):
                     self.currentMovie["title"], maxReviews=15
                 )
 
-                # Extract the TextInput object which contains the movie review text and metadata
+                # The reviews were already scored in one batched pass, so save
+                # that result instead of running the model over them again
                 textInput = results.get("text_input")
-                if textInput:
-                    # Use ApplicationServices to analyze and save the result
-                    analysisResult = services.analyzeText(textInput, saveToHistory=True)
-                    # Add the analysis result to the movie results for display
-                    results["analysis_result"] = analysisResult
+                if textInput and not results.get("analysis_fallback"):
+                    services.saveAnalysisResult(textInput, results["analysis_results"])
 
                 # Update UI on main thread
                 self._safe_after(lambda: self._displayAnalysisResults(results))
@@ -434,10 +432,12 @@ class MoviesPage(ctk.CTkFrame):
         if self._is_destroyed:
             return
 
-        logger.info(f"Displaying analysis results with keys: {list(results.keys())}")
-        logger.info(f"Primary sentiment: {results.get('primarySentiment', 'MISSING')}")
-        logger.info(f"Confidence: {results.get('confidence', 'MISSING')}")
-        logger.info(f"Review count: {results.get('reviewCount', 'MISSING')}")
+        logger.debug(
+            "Displaying analysis results: "
+            f"sentiment={results.get('primarySentiment', 'MISSING')} "
+            f"confidence={results.get('confidence', 'MISSING')} "
+            f"reviews={results.get('reviewCount', 'MISSING')}"
+        )
 
         # Clear previous results
         if self.analysisCard:
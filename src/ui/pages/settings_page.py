@@ -5,8 +5,14 @@ import customtkinter as ctk
 from config.settings import Settings
 from ui.components.base import ActionButton, Card, ScrollableFrame, StatusIndicator
 from ui.components.theme_manager import themeManager
+from utils.helpers import UIHelper
 from utils.logger import logger
 
+# Grid layouts shared by every settings card and the frames inside it
+_CARD_GRID = {"column": 0, "padx": 0, "pady": (0, 10), "sticky": "ew"}
+_SECTION_GRID = {"row": 0, "column": 0, "padx": 20, "pady": 20, "sticky": "ew"}
+_INFO_FRAME_GRID = {"row": 1, "column": 0, "padx": 20, "pady": (0, 20), "sticky": "ew"}
+
 
 class SettingsPage(ctk.CTkFrame):
     """Page for application settings."""
@@ -92,13 +98,13 @@ class SettingsPage(ctk.CTkFrame):
     def _createThemeSettings(self) -> None:
         """Create theme and appearance settings."""
         self.themeCard = Card(self.scrollableFrame, title="Theme & Appearance")
-        self.themeCard.grid(row=0, column=0, padx=0, pady=(0, 10), sticky="ew")
+        self.themeCard.grid(row=0, **_CARD_GRID)
 
         # Settings frame
         settingsFrame = ctk.CTkFrame(
             self.themeCard.contentFrame, fg_color="transparent"
         )
-        settingsFrame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
+        settingsFrame.grid(**_SECTION_GRID)
         settingsFrame.grid_columnconfigure(1, weight=1)
 
         # Theme selection
@@ -134,11 +140,11 @@ class SettingsPage(ctk.CTkFrame):
     def _createAPISettings(self) -> None:
         """Create API configuration settings."""
         self.apiCard = Card(self.scrollableFrame, title="API Configuration")
-        self.apiCard.grid(row=1, column=0, padx=0, pady=(0, 10), sticky="ew")
+        self.apiCard.grid(row=1, **_CARD_GRID)
 
         # Settings frame
         settingsFrame = ctk.CTkFrame(self.apiCard.contentFrame, fg_color="transparent")
-        settingsFrame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
+        settingsFrame.grid(**_SECTION_GRID)
         settingsFrame.grid_columnconfigure(1, weight=1)
 
         # Rate limiting
@@ -173,7 +179,7 @@ class SettingsPage(ctk.CTkFrame):
             fg_color=themeManager.getColor("surface"),
             corner_radius=8,
         )
-        statusFrame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="ew")
+        statusFrame.grid(**_INFO_FRAME_GRID)
 
         statusLabel = ctk.CTkLabel(
             statusFrame,
@@ -212,13 +218,13 @@ class SettingsPage(ctk.CTkFrame):
     def _createAnalysisSettings(self) -> None:
         """Create analysis configuration settings."""
         self.analysisCard = Card(self.scrollableFrame, title="Analysis Settings")
-        self.analysisCard.grid(row=2, column=0, padx=0, pady=(0, 10), sticky="ew")
+        self.analysisCard.grid(row=2, **_CARD_GRID)
 
         # Settings frame
         settingsFrame = ctk.CTkFrame(
             self.analysisCard.contentFrame, fg_color="transparent"
         )
-        settingsFrame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
+        settingsFrame.grid(**_SECTION_GRID)
         settingsFrame.grid_columnconfigure(1, weight=1)
 
         # Confidence threshold
@@ -243,7 +249,7 @@ class SettingsPage(ctk.CTkFrame):
             fg_color=themeManager.getColor("surface"),
             corner_radius=8,
         )
-        modelFrame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="ew")
+        modelFrame.grid(**_INFO_FRAME_GRID)
 
         modelLabel = ctk.CTkLabel(
             modelFrame,
@@ -270,11 +276,11 @@ class SettingsPage(ctk.CTkFrame):
     def _createDataSettings(self) -> None:
         """Create data management settings."""
         self.dataCard = Card(self.scrollableFrame, title="Data Management")
-        self.dataCard.grid(row=3, column=0, padx=0, pady=(0, 10), sticky="ew")
+        self.dataCard.grid(row=3, **_CARD_GRID)
 
         # Settings frame
         settingsFrame = ctk.CTkFrame(self.dataCard.contentFrame, fg_color="transparent")
-        settingsFrame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
+        settingsFrame.grid(**_SECTION_GRID)
         settingsFrame.grid_columnconfigure(1, weight=1)
 
         # Max history entries
@@ -297,7 +303,7 @@ class SettingsPage(ctk.CTkFrame):
             fg_color=themeManager.getColor("surface"),
             corner_radius=8,
         )
-        infoFrame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="ew")
+        infoFrame.grid(**_INFO_FRAME_GRID)
 
         infoLabel = ctk.CTkLabel(
             infoFrame,
@@ -318,9 +324,7 @@ class SettingsPage(ctk.CTkFrame):
         """Create action buttons."""
         buttonsFrame = ctk.CTkFrame(self.scrollableFrame, fg_color="transparent")
         buttonsFrame.grid(row=4, column=0, padx=0, pady=20, sticky="ew")
-        buttonsFrame.grid_columnconfigure(0, weight=1)
-        buttonsFrame.grid_columnconfigure(1, weight=1)
-        buttonsFrame.grid_columnconfigure(2, weight=1)
+        buttonsFrame.grid_columnconfigure((0, 1, 2), weight=1)
 
         # Save button
         saveButton = ActionButton(
@@ -390,14 +394,10 @@ class SettingsPage(ctk.CTkFrame):
         # Create confirmation dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Reset Settings")
-        dialog.geometry("400x200")
         dialog.transient(self.winfo_toplevel())
 
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (200 // 2)
-        dialog.geometry(f"400x200+{x}+{y}")
+        UIHelper.centerWindow(dialog, 400, 200)
 
         # Set grab after window is properly positioned and displayed
         dialog.after(1, dialog.grab_set)
@@ -426,8 +426,7 @@ class SettingsPage(ctk.CTkFrame):
         # Buttons frame
         buttonsFrame = ctk.CTkFrame(contentFrame, fg_color="transparent")
         buttonsFrame.pack(fill="x")
-        buttonsFrame.grid_columnconfigure(0, weight=1)
-        buttonsFrame.grid_columnconfigure(1, weight=1)
+        buttonsFrame.grid_columnconfigure((0, 1), weight=1)
 
         # Cancel button
         cancelButton = ctk.CTkButton(
@@ -479,14 +478,10 @@ class SettingsPage(ctk.CTkFrame):
         # Create about dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("About Text Gauntlet")
-        dialog.geometry("500x400")
         dialog.transient(self.winfo_toplevel())
 
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (400 // 2)
-        dialog.geometry(f"500x400+{x}+{y}")
+        UIHelper.centerWindow(dialog, 500, 400)
 
         # Set grab after window is properly positioned and displayed
         dialog.after(1, dialog.grab_set)
@@ -149,9 +149,9 @@ class TextPage(PageFrame):
         resultsFrame.grid_columnconfigure(1, weight=1)
 
         # Primary result
-        ctk.CTkLabel(
-            resultsFrame, text="Primary Sentiment:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=0, column=0, sticky="w", pady=(0, 10))
+        self._createFieldLabel(
+            resultsFrame, "Primary Sentiment:", 0, sticky="w", pady=(0, 10)
+        )
 
         self.primaryResultLabel = ctk.CTkLabel(
             resultsFrame,
@@ -163,9 +163,7 @@ class TextPage(PageFrame):
         )
 
         # Confidence score
-        ctk.CTkLabel(
-            resultsFrame, text="Confidence:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=1, column=0, sticky="w", pady=(0, 10))
+        self._createFieldLabel(resultsFrame, "Confidence:", 1, sticky="w", pady=(0, 10))
 
         self.confidenceLabel = ctk.CTkLabel(
             resultsFrame, text="N/A", text_color=themeManager.getColor("text_secondary")
@@ -175,9 +173,9 @@ class TextPage(PageFrame):
         )
 
         # Detailed scores
-        ctk.CTkLabel(
-            resultsFrame, text="Detailed Scores:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=2, column=0, sticky="nw", pady=(0, 10))
+        self._createFieldLabel(
+            resultsFrame, "Detailed Scores:", 2, sticky="nw", pady=(0, 10)
+        )
 
         self.scoresLabel = ctk.CTkLabel(
             resultsFrame,
@@ -188,9 +186,7 @@ class TextPage(PageFrame):
         self.scoresLabel.grid(row=2, column=1, sticky="nw", padx=(10, 0), pady=(0, 10))
 
         # Processing time
-        ctk.CTkLabel(
-            resultsFrame, text="Processing Time:", font=ctk.CTkFont(weight="bold")
-        ).grid(row=3, column=0, sticky="w")
+        self._createFieldLabel(resultsFrame, "Processing Time:", 3, sticky="w")
 
         self.timingLabel = ctk.CTkLabel(
             resultsFrame, text="N/A", text_color=themeManager.getColor("text_secondary")
@@ -258,12 +254,7 @@ class TextPage(PageFrame):
             # Update detailed scores
             scores = result.get("scores", [])
             if scores:
-                scoresText = "\n".join(
-                    [
-                        f"{score['label'].title()}: {score['score']:.1%}"
-                        for score in scores[:5]  # Show top 5 scores
-                    ]
-                )
+                scoresText = UIHelper.formatTopScores(scores, topN=5)
             else:
                 scoresText = "No detailed scores available"
 
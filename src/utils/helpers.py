@@ -1,6 +1,7 @@
 """Helper utilities for Text Gauntlet application."""
 
 import hashlib
+import heapq
 import time
 import uuid
 from collections.abc import Callable
@@ -179,8 +180,8 @@ class UIHelper:
         screenHeight = window.winfo_screenheight()
 
         # Calculate position
-        x = int((screenWidth / 2) - (width / 2))
-        y = int((screenHeight / 2) - (height / 2))
+        x = (screenWidth - width) // 2
+        y = (screenHeight - height) // 2
 
         # Set window geometry
         window.geometry(f"{width}x{height}+{x}+{y}")
@@ -193,18 +194,27 @@ class UIHelper:
     @staticmethod
     def formatEmotionScores(scores: list[dict[str, Any]], topN: int = 5) -> list[str]:
         """Format emotion scores for display."""
-        # Sort by score
-        sortedScores = sorted(scores, key=lambda x: x.get("score", 0), reverse=True)
+        # Select the top N scores without sorting the full list
+        topScores = heapq.nlargest(topN, scores, key=lambda x: x.get("score", 0))
 
         # Format top N scores
         formatted = []
-        for i, score in enumerate(sortedScores[:topN]):
+        for i, score in enumerate(topScores):
             label = score.get("label", "Unknown").title()
             value = UIHelper.formatScore(score.get("score", 0))
             formatted.append(f"{i + 1}. {label}: {value}")
 
         return formatted
 
+    @staticmethod
+    def formatTopScores(scores: list[dict[str, Any]], topN: int = 5) -> str:
+        """Format the highest scores as "Label: 12.3%" lines, best first."""
+        topScores = heapq.nlargest(topN, scores, key=lambda x: x.get("score", 0))
+        return "\n".join(
+            f"{score.get('label', 'Unknown').title()}: {score.get('score', 0):.1%}"
+            for score in topScores
+        )
+
     @staticmethod
     def createProgressCallback(
         totalSteps: int, updateCallback: Callable[[float, str], None] | None = None
@@ -0,0 +1,9 @@
+"""Shared pytest configuration for Text Gauntlet tests."""
+
+import sys
+from pathlib import Path
+
+# Make the application packages importable the same way main.py does
+srcPath = Path(__file__).parent.parent / "src"
+if str(srcPath) not in sys.path:
+    sys.path.insert(0, str(srcPath))
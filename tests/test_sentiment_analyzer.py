@@ -0,0 +1,249 @@
+"""Tests for batched sentiment scoring with a stub tokenizer and model."""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from config.settings import settings  # noqa: E402
+from core import sentiment_analyzer  # noqa: E402
+from core.models import SentimentScore, TextInput  # noqa: E402
+from core.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+
+_LABELS = ["negative", "neutral", "positive"]
+
+# Token ids; 0 is padding and every other word maps to a neutral id
+_VOCAB = {"good": 1, "bad": 2}
+_OTHER_TOKEN = 3
+
+# Small windows keep the long test texts readable
+_MAX_TOKENS = 4
+_WINDOW_STRIDE = 1
+
+
+def _tokenIds(text: str) -> list[int]:
+    return [_VOCAB.get(word, _OTHER_TOKEN) for word in text.split()]
+
+
+def _windows(ids: list[int], maxLength: int, stride: int | None) -> list[list[int]]:
+    """Split token ids into windows the way a fast tokenizer overflows them."""
+    if stride is None:
+        return [ids[:maxLength]]
+
+    windows = []
+    start = 0
+    while True:
+        windows.append(ids[start : start + maxLength])
+        if start + maxLength >= len(ids):
+            return windows
+        start += maxLength - stride
+
+
+def _windowLogits(window: list[int]) -> list[float]:
+    """Logits the stub model gives a window: bad count, 0, good count."""
+    return [
+        float(window.count(_VOCAB["bad"])),
+        0.0,
+        float(window.count(_VOCAB["good"])),
+    ]
+
+
+def _expectedScores(text: str) -> dict[str, float]:
+    """Class probabilities averaged over a text's windows, computed by hand."""
+    windows = _windows(_tokenIds(text), _MAX_TOKENS, _WINDOW_STRIDE)
+    totals = [0.0] * len(_LABELS)
+    for window in windows:
+        exps = [math.exp(logit) for logit in _windowLogits(window)]
+        for i, value in enumerate(exps):
+            totals[i] += value / sum(exps)
+    return {
+        label: total / len(windows)
+        for label, total in zip(_LABELS, totals, strict=True)
+    }
+
+
+def _assertScores(scores: list[SentimentScore], text: str) -> None:
+    expected = _expectedScores(text)
+    actual = {score.label: score.score for score in scores}
+    assert actual.keys() == expected.keys()
+    for label, probability in expected.items():
+        assert actual[label] == pytest.approx(probability, abs=1e-6)
+
+
+class StubEncoding(dict):
+    """Tensor dict offering the BatchEncoding methods the analyzer uses."""
+
+    def to(self, device: "torch.device") -> "StubEncoding":
+        return StubEncoding({key: value.to(device) for key, value in self.items()})
+
+
+class StubTokenizer:
+    """Whitespace tokenizer that pads and overflows like a fast tokenizer."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(
+        self,
+        texts: str | list[str],
+        max_length: int,
+        truncation: bool,
+        padding: bool,
+        return_tensors: str,
+        stride: int = 0,
+        return_overflowing_tokens: bool = False,
+    ) -> StubEncoding:
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        self.calls.append(texts)
+
+        windows: list[list[int]] = []
+        sampleMapping: list[int] = []
+        for sample, text in enumerate(texts):
+            for window in _windows(
+                _tokenIds(text),
+                max_length,
+                stride if return_overflowing_tokens else None,
+            ):
+                windows.append(window)
+                sampleMapping.append(sample)
+
+        width = max(len(window) for window in windows)
+        inputIds = torch.tensor(
+            [window + [0] * (width - len(window)) for window in windows]
+        )
+        encoding = StubEncoding(
+            input_ids=inputIds, attention_mask=(inputIds != 0).long()
+        )
+        if return_overflowing_tokens:
+            encoding["overflow_to_sample_mapping"] = torch.tensor(sampleMapping)
+        return encoding
+
+
+class StubModel:
+    """Scores each window by counting its "good" and "bad" tokens."""
+
+    device = torch.device("cpu")
+
+    def __init__(self) -> None:
+        self.windowCounts: list[int] = []
+
+    def __call__(
+        self, input_ids: "torch.Tensor", attention_mask: "torch.Tensor"
+    ) -> SimpleNamespace:
+        self.windowCounts.append(input_ids.shape[0])
+        good = (input_ids == _VOCAB["good"]).sum(dim=-1).float()
+        bad = (input_ids == _VOCAB["bad"]).sum(dim=-1).float()
+        logits = torch.stack([bad, torch.zeros_like(good), good], dim=-1)
+        return SimpleNamespace(logits=logits)
+
+
+@pytest.fixture
+def analyzer(monkeypatch: pytest.MonkeyPatch) -> SentimentAnalyzer:
+    """Analyzer wired to the stub tokenizer and model."""
+    monkeypatch.setattr(sentiment_analyzer, "_MAX_TOKENS", _MAX_TOKENS)
+    monkeypatch.setattr(sentiment_analyzer, "_WINDOW_STRIDE", _WINDOW_STRIDE)
+    monkeypatch.setattr(settings.model, "batchSize", 2)
+    monkeypatch.setattr(settings.cache, "enabled", True)
+
+    analyzer = SentimentAnalyzer()
+    analyzer.tokenizer = StubTokenizer()
+    analyzer.model = StubModel()
+    analyzer._classLabels = list(_LABELS)
+    analyzer.isLoaded = True
+    return analyzer
+
+
+def test_batchAnalyzeScoresTextsInOneBatch(analyzer: SentimentAnalyzer) -> None:
+    texts = ["good", "bad"]
+
+    results = analyzer.batchAnalyze([TextInput(text) for text in texts])
+
+    assert len(analyzer.tokenizer.calls) == 1
+    assert sorted(analyzer.tokenizer.calls[0]) == sorted(texts)
+    for result, text in zip(results, texts, strict=True):
+        _assertScores(result.scores, text)
+
+
+def test_batchAnalyzeOnlyScoresCacheMisses(analyzer: SentimentAnalyzer) -> None:
+    analyzer.analyzeText(TextInput("good good"))
+    analyzer.tokenizer.calls.clear()
+
+    results = analyzer.batchAnalyze([TextInput("good good"), TextInput("bad")])
+
+    assert analyzer.tokenizer.calls == [["bad"]]
+    _assertScores(results[0].scores, "good good")
+    _assertScores(results[1].scores, "bad")
+
+    # Batched scores are cached for later single-text analyses
+    analyzer.tokenizer.calls.clear()
+    _assertScores(analyzer.analyzeText(TextInput("bad")).scores, "bad")
+    assert analyzer.tokenizer.calls == []
+
+
+def test_batchAnalyzeKeepsInputOrderAfterLengthSort(
+    analyzer: SentimentAnalyzer,
+) -> None:
+    texts = ["good good good", "bad", "good bad bad", "good", "bad bad"]
+
+    results = analyzer.batchAnalyze([TextInput(text) for text in texts])
+
+    # Batches are built from the texts sorted by length, not in input order
+    assert analyzer.tokenizer.calls == [
+        ["bad", "good"],
+        ["bad bad", "good bad bad"],
+        ["good good good"],
+    ]
+    assert [result.text for result in results] == texts
+    for result, text in zip(results, texts, strict=True):
+        _assertScores(result.scores, text)
+
+
+def test_analyzeTextAveragesWindowsOfLongText(analyzer: SentimentAnalyzer) -> None:
+    # Ten tokens need three overlapping four-token windows
+    text = "good good good bad bad bad good good good good"
+
+    result = analyzer.analyzeText(TextInput(text))
+
+    assert analyzer.model.windowCounts == [3]
+    _assertScores(result.scores, text)
+    truncated = _expectedScores(" ".join(text.split()[:_MAX_TOKENS]))
+    assert {score.label: score.score for score in result.scores} != pytest.approx(
+        truncated
+    )
+
+
+def test_predictBatchWindowsMixedLengths(
+    analyzer: SentimentAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.model, "batchSize", 4)
+    longText = "good good good bad bad bad good good good good"
+    texts = ["bad", longText, "good bad"]
+
+    allScores = analyzer._predictBatch(texts)
+
+    # One forward pass over one window per short text and three for the long one
+    assert len(analyzer.tokenizer.calls) == 1
+    assert analyzer.model.windowCounts == [5]
+    for scores, text in zip(allScores, texts, strict=True):
+        _assertScores(scores, text)
+
+
+def test_predictBatchAveragesWindowsOntoTheirOwnText(
+    analyzer: SentimentAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings.model, "batchSize", 4)
+    # Opposite sentiments, so windows credited to the wrong text would show
+    positiveText = "good good good good good good bad"
+    negativeText = "bad bad bad bad bad bad bad good good good"
+    texts = [positiveText, "", negativeText]
+
+    allScores = analyzer._predictBatch(texts)
+
+    assert analyzer.model.windowCounts == [2 + 3]
+    _assertScores(allScores[0], positiveText)
+    assert allScores[0][0].label == "positive"
+    assert [(score.label, score.score) for score in allScores[1]] == [("neutral", 1.0)]
+    _assertScores(allScores[2], negativeText)
+    assert allScores[2][0].label == "negative"